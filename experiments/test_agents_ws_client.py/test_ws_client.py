@@ -10,9 +10,6 @@ from agents.realtime import (
     RealtimeModelEvent,
     RealtimeModelListener, RealtimeModelRawClientMessage, 
 )
-from openai.types.realtime import (
-    RealtimeResponseCreateParams, RealtimeFunctionTool,
-)
 
 with open('./temp.log', 'w') as f:
     class Listener(RealtimeModelListener):
@@ -38,8 +35,9 @@ with open('./temp.log', 'w') as f:
                 user_input='Turn on the lights.',
                 start_response=False,
             ))
-            response = RealtimeResponseCreateParams(
-                tools=[RealtimeFunctionTool(
+            response = dict(    # RealtimeResponseCreateParams, built as a plain dict
+                tools=[dict(    # RealtimeFunctionTool
+                    type='function',
                     name='set_light_state',
                     parameters={
                         "type": "object",
@@ -51,14 +49,13 @@ with open('./temp.log', 'w') as f:
                         },
                         "required": ["target"],
                     },
-                    type='function',
                 )],
             )
             await model.send_event(realtime_model_inputs.RealtimeModelSendRawMessage(
                 message=RealtimeModelRawClientMessage(
                     type='response.create',
                     other_data=dict(
-                        response=response.model_dump(),
+                        response=response,
                     ),
                 ),
             ))
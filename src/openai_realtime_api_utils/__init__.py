@@ -1,5 +1,7 @@
 __all__ = [
     'hook_handlers',
+    'WEBSOCKET_CONNECTION_OPTIONS',
+    'asyncio_run',
 ]
 
-from .shared import hook_handlers
+from .shared import hook_handlers, WEBSOCKET_CONNECTION_OPTIONS, asyncio_run
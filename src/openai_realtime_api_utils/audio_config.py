@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from functools import cached_property
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 import openai.types.realtime as tp_rt
 from openai.types.realtime import realtime_audio_formats
@@ -14,7 +14,7 @@ class UnderSpecified(Exception):
 class OverSpecified(Exception):
     pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigSpecification:
     '''
     If None, use whatever the OpenAI API server proposes.  
@@ -80,75 +80,102 @@ class ConfigSpecification:
                 format_info=format_info, 
             )
 
-@dataclass(frozen=True)
+# format type -> (default sample rate, n_bytes_per_sample, silence_sample)
+_FORMAT_TABLE: dict[type, tuple[int, int, bytes | None]] = {
+    realtime_audio_formats.AudioPCM : (24000, 2, b'\x00\x00'),    # OpenAI decided on 16-bit without documenting it
+    realtime_audio_formats.AudioPCMA: ( 8000, 1, None), 
+    realtime_audio_formats.AudioPCMU: ( 8000, 1, None), 
+    # silence: 0xD5 for a-law and 0xFF for u-law, but who knows about bit inversion?
+}
+
+@dataclass(frozen=True, slots=True)
 class FormatInfo:
     '''
     Use pure functions? Clean code.  
-    Use dataclass? Just for cached_property. Faster than lru_cache.  
+    Use dataclass? Derived fields are computed once in `__post_init__`, 
+    so reading them is a plain attribute access.  
     '''
     format: tp_rt.RealtimeAudioFormats
 
-    @cached_property
-    def sample_rate(self) -> int:
-        match self.format:
-            case realtime_audio_formats.AudioPCM(rate=rate):
-                return rate or 24000
-            case realtime_audio_formats.AudioPCMA:
-                return 8000
-            case realtime_audio_formats.AudioPCMU:
-                return 8000
-            case _:
-                raise ValueError(f'Unsupported audio format: {self.format}')
-    
-    @cached_property
-    def n_bytes_per_sample(self) -> int:
-        match self.format:
-            case realtime_audio_formats.AudioPCM():
-                return 2    # OpenAI decided on 16-bit without documenting it
-            case realtime_audio_formats.AudioPCMA():
-                return 1
-            case realtime_audio_formats.AudioPCMU():
-                return 1
-            case _:
-                raise ValueError(f'Unsupported audio format: {self.format}')
-
-    @cached_property
+    sample_rate       : int   = field(init=False, repr=False, compare=False)
+    n_bytes_per_sample: int   = field(init=False, repr=False, compare=False)
+    bytes_per_second  : int   = field(init=False, repr=False, compare=False)
+    ms_per_byte       : float = field(init=False, repr=False, compare=False)
+    _silence_sample: bytes | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        try:
+            sample_rate, n_bytes_per_sample, silence_sample = _FORMAT_TABLE[type(self.format)]
+        except KeyError:
+            raise ValueError(f'Unsupported audio format: {self.format}')
+        if isinstance(self.format, realtime_audio_formats.AudioPCM):
+            sample_rate = self.format.rate or sample_rate
+        bytes_per_second = sample_rate * N_CHANNELS * n_bytes_per_sample
+        object.__setattr__(self, 'sample_rate', sample_rate)
+        object.__setattr__(self, 'n_bytes_per_sample', n_bytes_per_sample)
+        object.__setattr__(self, 'bytes_per_second', bytes_per_second)
+        object.__setattr__(self, 'ms_per_byte', 1000.0 / bytes_per_second)
+        object.__setattr__(self, '_silence_sample', silence_sample)
+
+    @property
     def silence_sample(self) -> bytes:
-        match self.format:
-            case realtime_audio_formats.AudioPCM():
-                return b'\x00\x00'
-            case _:
-                # 0xD5 for a-law and 0xFF for u-law, but who knows about bit inversion?
-                raise ValueError(f'Unsupported audio format: {self.format}')
-
-    @cached_property
-    def bytes_per_second(self) -> int:
-        return (
-            self.sample_rate 
-            * N_CHANNELS 
-            * self.n_bytes_per_sample
-        )
-    
-    @cached_property
-    def ms_per_byte(self) -> float:
-        return 1000.0 / self.bytes_per_second
+        if self._silence_sample is None:
+            raise ValueError(f'Unsupported audio format: {self.format}')
+        return self._silence_sample
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=8)
+def _silence_page_and_view(
+    silence_sample: bytes, n_samples_per_page: int, 
+) -> tuple[bytes, memoryview]:
+    '''
+    Shared across ConfigInfo instances (e.g. mic and player) of equal format.  
+    '''
+    if not any(silence_sample):
+        silence_page = bytes(len(silence_sample) * n_samples_per_page)    # zero-filled by calloc
+    else:
+        silence_page = silence_sample * n_samples_per_page
+    return silence_page, memoryview(silence_page).toreadonly()
+
+@dataclass(frozen=True, slots=True)
 class ConfigInfo:
     format_info: FormatInfo
     n_samples_per_page: int
 
-    @cached_property
-    def n_bytes_per_page(self) -> int:
-        return N_CHANNELS * self.format_info.n_bytes_per_sample * self.n_samples_per_page
+    n_bytes_per_page: int   = field(init=False, repr=False, compare=False)
+    ms_per_page     : float = field(init=False, repr=False, compare=False)
+    _silence_page     : bytes      | None = field(init=False, repr=False, compare=False)
+    _silence_page_view: memoryview | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        n_bytes_per_page = N_CHANNELS * self.format_info.n_bytes_per_sample * self.n_samples_per_page
+        silence_sample = self.format_info._silence_sample
+        if silence_sample is None:
+            silence_page, silence_page_view = None, None
+        else:
+            silence_page, silence_page_view = _silence_page_and_view(
+                silence_sample, self.n_samples_per_page, 
+            )
+        object.__setattr__(self, 'n_bytes_per_page', n_bytes_per_page)
+        object.__setattr__(self, 'ms_per_page', (
+            self.n_samples_per_page / self.format_info.sample_rate * 1000.0
+        ))
+        object.__setattr__(self, '_silence_page', silence_page)
+        object.__setattr__(self, '_silence_page_view', silence_page_view)
     
-    @cached_property
+    @property
     def silence_page(self) -> bytes:
-        return self.format_info.silence_sample * self.n_samples_per_page
+        if self._silence_page is None:
+            raise ValueError(f'Unsupported audio format: {self.format_info.format}')
+        return self._silence_page
     
-    @cached_property
-    def ms_per_page(self) -> float:
-        return self.n_samples_per_page / self.format_info.sample_rate * 1000.0
+    @property
+    def silence_page_view(self) -> memoryview:
+        '''
+        Slice this instead of `silence_page` to avoid copying.  
+        '''
+        if self._silence_page_view is None:
+            raise ValueError(f'Unsupported audio format: {self.format_info.format}')
+        return self._silence_page_view
 
 EXAMPLE_SPECIFICATION = ConfigSpecification(
     format=None,
@@ -1,11 +1,29 @@
-from base64 import b64decode
-
 import openai.types.realtime as tp_rt
+try:    # optional-dependency: fast-base64
+    from pybase64 import b64decode as a2b_base64    # SIMD
+except ImportError:
+    from binascii import a2b_base64
 
 CACHE_KEY = 'delta_b64_decoded_cache'
 
 def b64_decode_cachable(event: tp_rt.ResponseAudioDeltaEvent, metadata: dict) -> bytes:
     """Decode base64 data, caching the result in metadata to avoid redundant work."""
-    if CACHE_KEY not in metadata:
-        metadata[CACHE_KEY] = b64decode(event.delta)
-    return metadata[CACHE_KEY]
+    cached = metadata.get(CACHE_KEY)
+    if cached is None:
+        cached = a2b_base64(event.delta)
+        metadata[CACHE_KEY] = cached
+    return cached
+
+def b64_decoded_len_cachable(event: tp_rt.ResponseAudioDeltaEvent, metadata: dict) -> int:
+    """
+    Length of the decoded data. Uses the cached decode if any, otherwise 
+    computes it from the base64 length without decoding.  
+    Assumes unwrapped base64, which is what the API sends.  
+    """
+    cached = metadata.get(CACHE_KEY)
+    if cached is not None:
+        return len(cached)
+    delta = event.delta
+    return len(delta) * 3 // 4 - (
+        2 if delta.endswith('==') else 1 if delta.endswith('=') else 0
+    )
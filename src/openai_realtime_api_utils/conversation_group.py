@@ -6,7 +6,7 @@ import typing as tp
 from .shared import L, is_root
 
 class ConversationGroup:
-    @dataclass
+    @dataclass(slots=True)
     class Cell:
         item_id: str
         response_id: str | None = None
@@ -20,7 +20,8 @@ class ConversationGroup:
 
     def __init__(self) -> None:
         self._main_conversation: list[ConversationGroup.Cell] = []
-        self._main_conversation_item_ids: set[str] = set()
+        self._id_to_index: dict[str, int] = {}  # item_id -> position in _main_conversation
+        self._id_to_cell: dict[str, ConversationGroup.Cell] = {}    # main conversation and OOB
         self.main_conversation_id: str | None = None
         self.trashed_cells: list[ConversationGroup.Cell] = []
         self.out_of_band_cells: dict[str, ConversationGroup.Cell] = {}
@@ -32,16 +33,14 @@ class ConversationGroup:
             assert self.main_conversation_id == conversation_id
     
     def seek(self, item_id: str) -> int:
-        cell_i, = [
-            i for i, cell in enumerate(self._main_conversation) 
-            if cell.item_id == item_id
-        ]
-        return cell_i
+        return self._id_to_index[item_id]
+    
+    def _reindex_from(self, start: int) -> None:
+        for i in range(start, len(self._main_conversation)):
+            self._id_to_index[self._main_conversation[i].item_id] = i
 
     def get_cell_from_id(self, item_id: str) -> Cell:
-        if self.main_conversation_contains(item_id):
-            return self._main_conversation[self.seek(item_id)]
-        return self.out_of_band_cells[item_id]
+        return self._id_to_cell[item_id]
     
     def index_after(
         self, previous_item_id: str | None, 
@@ -57,21 +56,24 @@ class ConversationGroup:
     ) -> Cell:
         assert cell.item_id != L.root
         assert not [x for x in self.out_of_band_cells.values() if x.item_id == cell.item_id]
-        self._main_conversation.insert(
-            self.index_after(previous_item_id), cell, 
-        )
-        assert cell.item_id not in self._main_conversation_item_ids
-        self._main_conversation_item_ids.add(cell.item_id)
+        assert cell.item_id not in self._id_to_index
+        cell_i = self.index_after(previous_item_id)
+        self._main_conversation.insert(cell_i, cell)
+        self._reindex_from(cell_i)
+        self._id_to_cell[cell.item_id] = cell
         return cell
     
     def move(
         self, item_id: str, 
         previous_item_id: str | None, 
     ) -> Cell:
-        cell = self._main_conversation.pop(self.seek(item_id))
-        self._main_conversation.insert(
-            self.index_after(previous_item_id), cell, 
-        )
+        old_i = self.seek(item_id)
+        cell = self._main_conversation.pop(old_i)
+        del self._id_to_index[item_id]
+        self._reindex_from(old_i)
+        new_i = self.index_after(previous_item_id)
+        self._main_conversation.insert(new_i, cell)
+        self._reindex_from(new_i)
         return cell
     
     def previousItemIdOf(self, item_id: str) -> str:
@@ -82,8 +84,11 @@ class ConversationGroup:
             return self._main_conversation[cell_i - 1].item_id
     
     def trash(self, item_id: str) -> None:
-        self.trashed_cells.append(self._main_conversation.pop(self.seek(item_id)))
-        self._main_conversation_item_ids.remove(item_id)
+        cell_i = self.seek(item_id)
+        self.trashed_cells.append(self._main_conversation.pop(cell_i))
+        del self._id_to_index[item_id]
+        del self._id_to_cell[item_id]
+        self._reindex_from(cell_i)
     
     def touch(self, item_id: str, event_id: str | None) -> None:
         self.get_cell_from_id(item_id).touched_by_event_ids.append(event_id)
@@ -95,12 +100,13 @@ class ConversationGroup:
             return self._main_conversation[-1].item_id
     
     def main_conversation_contains(self, item_id: str) -> bool:
-        return item_id in self._main_conversation_item_ids
+        return item_id in self._id_to_index
     
     def safe_add_oob(self, cell: Cell) -> Cell:
         assert not self.main_conversation_contains(cell.item_id)
         assert cell.item_id not in self.out_of_band_cells
         self.out_of_band_cells[cell.item_id] = cell
+        self._id_to_cell[cell.item_id] = cell
         return cell
     
     def iter_main_conversation(self):
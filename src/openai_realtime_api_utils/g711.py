@@ -0,0 +1,45 @@
+'''
+G.711 (A-law / u-law) to 16-bit linear PCM.  
+Uses `audioop` if available (C, but removed in Python 3.13). 
+Otherwise, a 256-entry lookup table per law.  
+'''
+
+from array import array
+
+def _alaw_to_linear(a: int) -> int:
+    a ^= 0x55
+    t = (a & 0x0F) << 4
+    seg = (a & 0x70) >> 4
+    if seg == 0:
+        t += 8
+    elif seg == 1:
+        t += 0x108
+    else:
+        t = (t + 0x108) << (seg - 1)
+    return t if a & 0x80 else -t
+
+def _ulaw_to_linear(u: int) -> int:
+    u = ~u & 0xFF
+    t = (((u & 0x0F) << 3) + 0x84) << ((u & 0x70) >> 4)
+    return 0x84 - t if u & 0x80 else t - 0x84
+
+ALAW_TO_LINEAR: tuple[int, ...] = tuple(_alaw_to_linear(x) for x in range(256))
+ULAW_TO_LINEAR: tuple[int, ...] = tuple(_ulaw_to_linear(x) for x in range(256))
+
+def alaw2lin16_lut(data: bytes) -> bytes:
+    return array('h', map(ALAW_TO_LINEAR.__getitem__, data)).tobytes()
+
+def ulaw2lin16_lut(data: bytes) -> bytes:
+    return array('h', map(ULAW_TO_LINEAR.__getitem__, data)).tobytes()
+
+try:
+    import audioop
+except ImportError:
+    alaw2lin16 = alaw2lin16_lut
+    ulaw2lin16 = ulaw2lin16_lut
+else:
+    def alaw2lin16(data: bytes) -> bytes:
+        return audioop.alaw2lin(data, 2)
+    
+    def ulaw2lin16(data: bytes) -> bytes:
+        return audioop.ulaw2lin(data, 2)
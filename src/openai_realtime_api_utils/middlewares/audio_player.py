@@ -5,7 +5,6 @@ from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
 import asyncio
-import threading
 
 import pyaudio
 import openai.types.realtime as tp_rt
@@ -26,6 +25,12 @@ class AudioPlayer:
     to provide audio format and then opens stream. Otherwise, opens stream 
     immediately.  
     Emits an event on finishing playing an assistant speech via `on_speech_end_handlers`.  
+
+    Threading: the asyncio thread produces and the PortAudio callback consumes, 
+    lock-free. The callback only reads `self.speeches` once and uses 
+    GIL-atomic deque ops. `interrupt` swaps in a new deque rather than 
+    mutating the one the callback may be holding, and marks the old 
+    speeches interrupted so a callback still holding them stays silent.  
     '''
 
     roster_manager = MetadataHandlerRosterManager('AudioPlayer')
@@ -49,7 +54,8 @@ class AudioPlayer:
         self.config_info: ConfigInfo | None = None
         self.stream: pyaudio.Stream | None = None
         self.speeches: deque[Speech] = deque()
-        self.lock = threading.Lock()
+        self._speech_index: dict[tuple[str, int], Speech] = {}  # asyncio thread only
+        self.asyncio_loop = asyncio.get_event_loop()
         self.pyaudio_niceness_manager = NicenessManager()
         self.maybe_open_stream()    # Why this soon? To fail fast if config unsupported by host.  
     
@@ -89,21 +95,33 @@ class AudioPlayer:
         return self.config_info
     
     def on_audio_out(self, in_data, frame_count, time_info, status):
-        self.pyaudio_niceness_manager.maybe_set(ThreadPriority.high)
-        with self.lock:
-            if not self.speeches:
-                return (
-                    self.config_info.silence_page, # type: ignore
-                    pyaudio.paContinue, 
-                )
-            speech = self.speeches[0]
-            data, n_content_bytes = speech.buffer.pop()
-            if self.playback_tracker_thread_safe is not None:
-                self.playback_tracker_thread_safe.update_soon_threadsafe(
-                    speech, n_content_bytes,
-                )
+        if not self.pyaudio_niceness_manager.has_set:   # skip the call on every later page
+            self.pyaudio_niceness_manager.maybe_set(ThreadPriority.high)
+        speeches = self.speeches
+        try:
+            speech = speeches[0]
+        except IndexError:
+            return (
+                self.config_info.silence_page, # type: ignore
+                pyaudio.paContinue, 
+            )
+        if speech.is_interrupted:   # old deque, read before `interrupt` swapped it
+            return (
+                self.config_info.silence_page, # type: ignore
+                pyaudio.paContinue, 
+            )
+        data, n_content_bytes = speech.buffer.pop()
+        is_finished = speech.is_mission_accomplished()
+        if is_finished:
+            speeches.popleft()
+        if self.playback_tracker_thread_safe is not None:
+            self.playback_tracker_thread_safe.update_soon_threadsafe(
+                speech, n_content_bytes,
+            )
+        if is_finished:
+            self.asyncio_loop.call_soon_threadsafe(self._on_speech_end, speech)
         return (
-            bytes(data), # what a letdown! "argument 1 must be read-only bytes-like object, not memoryview"
+            data,   # bytes; PyAudio rejects memoryview
             pyaudio.paContinue, 
         )
     
@@ -121,26 +139,17 @@ class AudioPlayer:
     def get_speech(
         self, item_id: str, content_index: int,
     ) -> Speech:
-        for speech in self.speeches:
-            if (
-                speech.item_id == item_id and 
-                speech.content_index == content_index
-            ):
-                return speech
-        raise KeyError(f'No speech found for item_id={item_id}, item_content_index={content_index}')
+        try:
+            return self._speech_index[(item_id, content_index)]
+        except KeyError:
+            raise KeyError(f'No speech found for item_id={item_id}, item_content_index={content_index}')
     
     @roster_manager.decorate
     def server_event_handler(
         self, event: tp_rt.RealtimeServerEvent, metadata: dict, _,
     ) -> tuple[tp_rt.RealtimeServerEvent, dict]:
         match event:
-            case tp_rt.SessionUpdatedEvent():
-                assert isinstance(event.session, tp_rt.RealtimeSessionCreateRequest)
-                assert event.session.audio is not None
-                assert event.session.audio.output is not None
-                assert event.session.audio.output.format is not None
-                self._set_audio_config(event.session.audio.output.format)
-                self.maybe_open_stream()
+            # High-rate delta first: arms are disjoint types, so order is only cost.  
             case tp_rt.ResponseAudioDeltaEvent():
                 '''
                 We assume single stream.  
@@ -159,9 +168,18 @@ class AudioPlayer:
                     except KeyError:
                         pass    # item already interrupted
                     else:
-                        s = b64_decode_cachable(event, metadata)
-                        with self.lock:
-                            buffer.append(s)
+                        buffer.append(b64_decode_cachable(event, metadata))
+            case tp_rt.SessionUpdatedEvent():
+                session = event.session
+                assert isinstance(session, tp_rt.RealtimeSessionCreateRequest)
+                audio = session.audio
+                assert audio is not None
+                output = audio.output
+                assert output is not None
+                format = output.format
+                assert format is not None
+                self._set_audio_config(format)
+                self.maybe_open_stream()
             case tp_rt.ResponseContentPartAddedEvent():
                 assert self.config_info is not None, (
                     'Looks like a speech event arrived before session config.',
@@ -172,8 +190,8 @@ class AudioPlayer:
                         content_index=event.content_index,
                         buffer=Buffer(self.config_info),
                     )
-                    with self.lock:
-                        self.speeches.append(speech)
+                    self._speech_index[(speech.item_id, speech.content_index)] = speech
+                    self.speeches.append(speech)
             case tp_rt.ResponseContentPartDoneEvent():
                 if event.part.type == 'audio':
                     try:
@@ -183,12 +201,24 @@ class AudioPlayer:
                     except KeyError:
                         pass    # item already interrupted
                     else:
-                        speech.has_more_to_come = False
+                        speech.buffer.flush()
+                        speech.has_more_to_come = False # after flush, for the callback
         return event, metadata
     
+    def _on_speech_end(self, speech: Speech) -> None:
+        if speech.is_interrupted:
+            return
+        self._speech_index.pop((speech.item_id, speech.content_index), None)
+        for handler in self.on_speech_end_handlers.values():
+            asyncio.create_task(handler(speech.item_id, speech.content_index))
+    
     def interrupt(self, item_id: str) -> None:
         _ = item_id
-        self.speeches.clear()
+        old_speeches = self.speeches
+        self.speeches = deque()
+        for speech in tuple(old_speeches):  # one C call under the GIL; callback may popleft
+            speech.is_interrupted = True
+        self._speech_index = {}
         if self.playback_tracker_thread_safe is not None:
             self.playback_tracker_thread_safe.inner.on_interrupted()
     
@@ -203,65 +233,73 @@ class AudioPlayer:
 
 class Buffer:
     '''
+    Single-producer (`append`, `flush`) single-consumer (`pop`) page queue.  
+
     State invariants:  
     - len(x) == n_bytes_per_page for any x in self.dq.  
-    - self.tail is None or len(self.tail) < n_bytes_per_page.  
+    - 0 <= self._tail_len < n_bytes_per_page.  
+    - self._tail_buf[:self._tail_len] is the partial page after self.dq.  
+      Only the producer touches it.  
 
     Method behaviors:  
-    - `append` and `pop` forms a queue-like orderedness on the bytes.  
-    - `pop` returns exactly one page, padding with silence if necessary.  
+    - `append`, `flush` and `pop` forms a queue-like orderedness on the bytes.  
+    - `pop` returns exactly one page, or a silence page if none is ready.  
     - `append` can take arbitrary length bytes.  
+    - `flush` pads the partial tail page with silence and enqueues it.  
 
     Optimization rationale:  
-    - Favor memoryview. Avoid copying.  
+    - Pages are stored as `bytes`, because PyAudio rejects memoryview. 
+    Slicing happens in `append` (asyncio thread), so that `pop` 
+    (PortAudio callback) never copies a full page.  
+    - The partial tail page is accumulated in place in one reused bytearray.  
+    - The consumer only does `deque.popleft`, which is GIL-atomic. No lock.  
     '''
 
     def __init__(self, config_info: ConfigInfo):
         self.config_info = config_info
 
-        self.dq: deque[memoryview | bytes] = deque()
-        self.tail: bytes | None = None
+        self.dq: deque[tuple[bytes, int]] = deque()   # (page, n_content_bytes)
+        self._tail_buf = bytearray(config_info.n_bytes_per_page)
+        self._tail_len = 0
     
-    def pop(self) -> tuple[bytes | memoryview, int]:
-        n_bytes_per_page = self.config_info.n_bytes_per_page
+    def pop(self) -> tuple[bytes, int]:
         try:
-            return self.dq.popleft(), n_bytes_per_page
+            return self.dq.popleft()
         except IndexError:
-            if self.tail is None:
-                return self.config_info.silence_page, 0
-            result = self.tail + self.config_info.silence_page[
-                len(self.tail):
-            ]
-            n_content_bytes = len(self.tail)
-            self.tail = None
-            return result, n_content_bytes
+            return self.config_info.silence_page, 0
     
     def append(self, data: bytes):
         n_bytes_per_page = self.config_info.n_bytes_per_page
-        mv = memoryview(data)
-        if self.tail is not None:
-            tail_short_by = (
-                n_bytes_per_page - len(self.tail)
-            )
-            self.tail += mv[:tail_short_by]
-            if len(self.tail) < n_bytes_per_page:
-                return
-            self.dq.append(self.tail)
-            self.tail = None
-            mv = mv[tail_short_by:]
-        while len(mv):
-            segment, mv = (
-                mv[:n_bytes_per_page ], 
-                mv[ n_bytes_per_page:], 
-            )
-            if len(segment) == n_bytes_per_page:
-                self.dq.append(segment)
-            else:
-                self.tail = bytes(segment)
+        start = 0
+        end = len(data)
+        if self._tail_len != 0:
+            take = min(n_bytes_per_page - self._tail_len, end)
+            self._tail_buf[self._tail_len : self._tail_len + take] = memoryview(data)[:take]
+            self._tail_len += take
+            if self._tail_len < n_bytes_per_page:
                 return
+            self.dq.append((bytes(self._tail_buf), n_bytes_per_page))
+            self._tail_len = 0
+            start = take
+        while end - start >= n_bytes_per_page:
+            self.dq.append((data[start : start + n_bytes_per_page], n_bytes_per_page))
+            start += n_bytes_per_page
+        if start < end:
+            self._tail_len = end - start
+            self._tail_buf[:self._tail_len] = memoryview(data)[start:]
+    
+    def flush(self) -> None:
+        n_content_bytes = self._tail_len
+        if n_content_bytes == 0:
+            return
+        self._tail_buf[n_content_bytes:] = self.config_info.silence_page_view[
+            n_content_bytes:
+        ]
+        self._tail_len = 0
+        self.dq.append((bytes(self._tail_buf), n_content_bytes))
     
     def is_empty(self) -> bool:
-        return len(self.dq) == 0 and self.tail is None
+        return len(self.dq) == 0 and self._tail_len == 0
 
 @dataclass
 class Speech:
@@ -269,6 +307,7 @@ class Speech:
     content_index: int
     buffer: Buffer
     has_more_to_come: bool = True   # if interrupted, unchanged.  
+    is_interrupted: bool = False
 
     def is_mission_accomplished(self) -> bool:
         return not self.has_more_to_come and self.buffer.is_empty()
@@ -285,20 +324,14 @@ class RealtimePlaybackTrackerThreadSafe:
     
     def update(self, speech: Speech, n_content_bytes: int) -> None:
         # May run after all is destroyed.  
+        if speech.is_interrupted:   # page was popped before `interrupt` ran
+            return
         assert self.parent.config_info is not None
-        finished_speeches = list[Speech]()
-        with self.parent.lock:
-            while self.parent.speeches and self.parent.speeches[0].is_mission_accomplished():
-                finished_speeches.append(self.parent.speeches.popleft())
-            self.inner.on_play_ms(
-                speech.item_id, 
-                speech.content_index, 
-                n_content_bytes * self.parent.config_info.format_info.ms_per_byte,
-            )
-        for finished_speech in finished_speeches:
-            for handler in self.parent.on_speech_end_handlers.values():
-                coro = handler(finished_speech.item_id, finished_speech.content_index)
-                asyncio.create_task(coro)
+        self.inner.on_play_ms(
+            speech.item_id, 
+            speech.content_index, 
+            n_content_bytes * self.parent.config_info.format_info.ms_per_byte,
+        )
     
     def update_soon_threadsafe(self, speech: Speech, n_content_bytes: int) -> None:
         self.asyncio_loop.call_soon_threadsafe(
@@ -1,5 +1,7 @@
 import asyncio
-from functools import cached_property
+from collections import OrderedDict
+from contextlib import contextmanager
+import logging
 import typing as tp
 import warnings
 
@@ -11,10 +13,14 @@ import websockets
 from .shared import MetadataHandlerRosterManager
 from .track_config import TrackConfig
 from .track_conversation import TrackConversation
-from ..audio_config import FormatInfo as AudioFormatInfo
 
 OnInterruptHandler = tp.Callable[[tp.Annotated[str, 'item_id']], None]
 
+logger = logging.getLogger(__name__)
+
+# No variable fields, so shared. Client handlers copy before adding fields (e.g. GiveClientEventId).  
+CANCEL_EVENT: tp_rt.ResponseCancelEventParam = {'type': 'response.cancel'}
+
 class Interrupt:
     '''
     - Whenever:
@@ -35,6 +41,7 @@ class Interrupt:
     '''
 
     IS_DURING_USER_SPEECH = 'is_during_user_speech'
+    MAX_ALREADY_INTERRUPTED = 4096  # only recent items can see delayed events
     
     roster_manager = MetadataHandlerRosterManager('Interrupt')
 
@@ -53,12 +60,23 @@ class Interrupt:
         self.playback_tracker = playback_tracker
         self.on_interrupt_handlers = on_interrupt_handlers
         self.interruptee_type = interruptee_type
+        interruptee_roster_manager = interruptee_type.roster_manager
+        assert isinstance(interruptee_roster_manager, MetadataHandlerRosterManager)
+        self._interruptee_handler_name: str = interruptee_roster_manager.handler_name
 
         self.is_user_talking = False
-        self._send_with_handlers: tp.Callable[
+        self.send_with_handlers: tp.Callable[
             [tp_rt.RealtimeClientEventParam], tp.Awaitable[None], 
-        ] | None = None
-        self.already_interrupted: set[str] = set()
+        ] = connection.send    # until `register_send_with_handlers`
+        self._is_send_with_handlers_registered = False
+        self.already_interrupted: OrderedDict[str, None] = OrderedDict()  # bounded, oldest first
+        self.interrupt_queue = asyncio.Queue[tuple[str, int, float]]()
+        self._worker_task: asyncio.Task | None = None
+        self._server_event_dispatch: dict[type, tp.Callable[[tp.Any, dict], None]] = {
+            tp_rt.InputAudioBufferSpeechStartedEvent: self._on_speech_started_event, 
+            tp_rt.InputAudioBufferSpeechStoppedEvent: self._on_speech_stopped_event, 
+            tp_rt.ResponseAudioDeltaEvent           : self._on_audio_delta_event, 
+        }
     
     def register_send_with_handlers(
         self, 
@@ -69,19 +87,8 @@ class Interrupt:
         '''
         Give me the `send` yielded by `hook_handlers`.  
         '''
-        self._send_with_handlers = send_with_handlers
-    
-    @cached_property
-    def send_with_handlers(self) -> tp.Callable[
-        [tp_rt.RealtimeClientEventParam], tp.Awaitable[None], 
-    ]:
-        if self._send_with_handlers is None:
-            warnings.warn(
-                'send_with_handlers not registered yet, using connection.send directly',
-                RuntimeWarning,
-            )
-            return self.connection.send
-        return self._send_with_handlers
+        self.send_with_handlers = send_with_handlers
+        self._is_send_with_handlers_registered = True
     
     def set_is_user_talking(self, value: bool, /) -> None:
         '''
@@ -123,12 +130,39 @@ class Interrupt:
     ) -> None:
         if current_item_id in self.already_interrupted:
             return
-        self.already_interrupted.add(current_item_id)
-        asyncio.create_task(self._interrupt(
+        self.already_interrupted[current_item_id] = None
+        if len(self.already_interrupted) > __class__.MAX_ALREADY_INTERRUPTED:
+            self.already_interrupted.popitem(last=False)
+        self.interrupt_queue.put_nowait((
             current_item_id,
             current_item_content_index,
             elapsed_ms,
         ))
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(
+                self.worker(), name='Interrupt_worker', 
+            )
+    
+    async def worker(self) -> None:
+        '''
+        One long-lived consumer, so interrupts run strictly in order.  
+        A failed interrupt is logged and does not stop the later ones.  
+        '''
+        while True:
+            args = await self.interrupt_queue.get()
+            try:
+                await self._interrupt(*args)
+            except Exception:
+                logger.exception('Interrupt failed: item_id=%r', args[0])
+    
+    @contextmanager
+    def context(self):
+        try:
+            yield self
+        finally:
+            if self._worker_task is not None:
+                self._worker_task.cancel()
+                self._worker_task = None
     
     async def _interrupt(
         self, 
@@ -140,37 +174,40 @@ class Interrupt:
         cell = self.track_conversation.conversation_group.get_cell_from_id(
             current_item_id, 
         )
-        assert self.track_config.audio_format_output is not None
-        speech_total_ms = cell.audio_total_bytes * AudioFormatInfo(
-            self.track_config.audio_format_output
-        ).ms_per_byte
-        progress_ratio = elapsed_ms / speech_total_ms
-        item = self.track_conversation.all_items[current_item_id]
+        item = self.track_conversation.get_item(current_item_id)
         assert isinstance(item, tp_rt.RealtimeConversationItemAssistantMessage)
-        content = item.content[current_item_content_index]
+        transcript = item.content[current_item_content_index].transcript
+        if transcript and elapsed_ms > 0:
+            format_info = self.track_config.audio_format_output_info
+            assert format_info is not None
+            speech_total_ms = cell.audio_total_bytes * format_info.ms_per_byte
+            truncated_transcript = transcript[  # approximately
+                :round(len(transcript) * elapsed_ms / speech_total_ms)
+            ]
+        else:   # None stays None; nothing played means nothing heard
+            truncated_transcript = None if transcript is None else ''
         cell.truncate_info = (
             current_item_content_index, 
             round(elapsed_ms), 
-            content.transcript[ # approximately
-                :round(len(content.transcript) * progress_ratio)
-            ] if content.transcript is not None else None,
+            truncated_transcript,
         )
         for handler in self.on_interrupt_handlers:
             handler(current_item_id) # pause audio playback, and more
-        try:
-            await self.send_with_handlers(
-                tp_rt.ResponseCancelEventParam(
-                    type='response.cancel',
-                ),
-            )
-            await self.send_with_handlers(
-                tp_rt.ConversationItemTruncateEventParam(
-                    type='conversation.item.truncate',
-                    item_id=current_item_id,
-                    content_index=current_item_content_index,
-                    audio_end_ms=round(elapsed_ms),
-                ),
+        truncate_event: tp_rt.ConversationItemTruncateEventParam = {
+            'type': 'conversation.item.truncate',
+            'item_id': current_item_id,
+            'content_index': current_item_content_index,
+            'audio_end_ms': round(elapsed_ms),
+        }
+        if not self._is_send_with_handlers_registered:
+            warnings.warn(
+                'send_with_handlers not registered yet, using connection.send directly',
+                RuntimeWarning,
             )
+        try:
+            # In sequence: cancel must reach the server before truncate.  
+            await self.send_with_handlers(CANCEL_EVENT)
+            await self.send_with_handlers(truncate_event)
         except websockets.ConnectionClosedOK:
             pass
 
@@ -178,33 +215,41 @@ class Interrupt:
     def server_event_handler(
         self, event: tp_rt.RealtimeServerEvent, metadata: dict, _,
     ) -> tuple[tp_rt.RealtimeServerEvent | None, dict]:
-        # >>> the interruptee handler must run after Interrupt handler
-        assert isinstance(
-            interruptee_roster_manager := self.interruptee_type.roster_manager, 
-            MetadataHandlerRosterManager, 
-        )
-        assert not self.roster_manager.is_in_roster(
-            interruptee_roster_manager.handler_name, metadata, 
-        )
-        # <<<
-        match event:
-            case tp_rt.InputAudioBufferSpeechStartedEvent():
-                self.is_user_talking = True
-                self._on_speech_started()
-            case tp_rt.InputAudioBufferSpeechStoppedEvent():
-                self.is_user_talking = False
-            case tp_rt.ResponseAudioDeltaEvent():
-                if self.is_user_talking:
-                    state = self.playback_tracker.get_state()
-                    if state['current_item_id'] == event.item_id:
-                        elapsed = state['elapsed_ms'] or 0.0
-                    else:
-                        elapsed = 0.0
-                    assert elapsed == 0.0, elapsed  # this new speech must have not started yet
-                    self._start_interrupt(
-                        event.item_id,
-                        event.content_index,
-                        elapsed,
-                    )
-                    metadata[__class__.IS_DURING_USER_SPEECH] = True
+        # type dispatch: one dict lookup instead of a `match` ladder per event
+        handler = self._server_event_dispatch.get(type(event))
+        if handler is None:
+            return event, metadata  # most traffic; nothing to order against
+        if __debug__:   # the interruptee handler must run after Interrupt handler
+            assert not self.roster_manager.is_in_roster(
+                self._interruptee_handler_name, metadata, 
+            )
+        handler(event, metadata)
         return event, metadata
+    
+    def _on_speech_started_event(
+        self, event: tp_rt.InputAudioBufferSpeechStartedEvent, metadata: dict, 
+    ) -> None:
+        self.is_user_talking = True
+        self._on_speech_started()
+    
+    def _on_speech_stopped_event(
+        self, event: tp_rt.InputAudioBufferSpeechStoppedEvent, metadata: dict, 
+    ) -> None:
+        self.is_user_talking = False
+    
+    def _on_audio_delta_event(
+        self, event: tp_rt.ResponseAudioDeltaEvent, metadata: dict, 
+    ) -> None:
+        if self.is_user_talking:
+            state = self.playback_tracker.get_state()
+            if state['current_item_id'] == event.item_id:
+                elapsed = state['elapsed_ms'] or 0.0
+            else:
+                elapsed = 0.0
+            assert elapsed == 0.0, elapsed  # this new speech must have not started yet
+            self._start_interrupt(
+                event.item_id,
+                event.content_index,
+                elapsed,
+            )
+            metadata[__class__.IS_DURING_USER_SPEECH] = True
@@ -27,20 +27,19 @@ def interruptable_audio_player(
         playback_tracker,
         skip_delta_metadata_keyword=Interrupt.IS_DURING_USER_SPEECH,
     ).context() as audio_player:
-        interrupt = Interrupt(
+        with Interrupt(
             connection, 
             track_config,
             track_conversation,
             playback_tracker, 
             on_interrupt_handlers=[audio_player.interrupt, *on_interrupt_handlers],
             interruptee_type=AudioPlayer, 
-        )
-
-        yield (
-            audio_player, interrupt, 
-            (
-                interrupt.server_event_handler,
-                audio_player.server_event_handler,
-            ), # order matters
-            interrupt.register_send_with_handlers, 
-        )
+        ).context() as interrupt:
+            yield (
+                audio_player, interrupt, 
+                (
+                    interrupt.server_event_handler,
+                    audio_player.server_event_handler,
+                ), # order matters
+                interrupt.register_send_with_handlers, 
+            )
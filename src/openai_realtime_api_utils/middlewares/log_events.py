@@ -5,9 +5,16 @@ import openai.types.realtime as tp_rt
 
 from ..shared import (
     str_server_event_omit_audio, str_client_event_omit_audio, 
+    CLIENT_EVENT_CACHE_KEY, 
 )
+from ..b64_decode_cachable import CACHE_KEY as B64_CACHE_KEY
 from .shared import MetadataHandlerRosterManager
 
+CACHE_KEYS = frozenset((B64_CACHE_KEY, CLIENT_EVENT_CACHE_KEY))
+
+def metadata_omit_caches(metadata: dict) -> dict:
+    return {k: v for k, v in metadata.items() if k not in CACHE_KEYS}
+
 class LogEvents:
     roster_manager = MetadataHandlerRosterManager('LogEvents')
 
@@ -25,14 +32,20 @@ class LogEvents:
         str_client_event: tp.Callable[[
             tp_rt.RealtimeClientEventParam
         ], str] = str_client_event_omit_audio,
+        level: int | None = None, 
     ):
+        '''
+        `level`: if given, set on this module's logger. Otherwise the 
+        logger's level is left as configured by the user.  
+        '''
         self.filter_server = filter_server
         self.filter_client = filter_client
         self.str_server_event = str_server_event
         self.str_client_event = str_client_event
 
-        self.logger = logging.getLogger()
-        self.logger.setLevel(logging.DEBUG)
+        self.logger = logging.getLogger(__name__)
+        if level is not None:
+            self.logger.setLevel(level)
     
     @roster_manager.decorate
     def server_event_handler(
@@ -44,15 +57,17 @@ class LogEvents:
             match event:
                 case tp_rt.RealtimeErrorEvent():
                     if event.error.code == 'response_cancel_not_active':
-                        f = self.logger.info
+                        level = logging.INFO
                     else:
-                        f = self.logger.warning
+                        level = logging.WARNING
                 case _:
-                    f = self.logger.debug
-            f(
-                f'Server: {self.str_server_event(event)}\n'
-                f'event {metadata = }', 
-            )
+                    level = logging.DEBUG
+            if self.logger.isEnabledFor(level):     # stringifying the event is the cost
+                self.logger.log(
+                    level, 
+                    'Server: %s\nevent metadata = %s', 
+                    self.str_server_event(event), metadata_omit_caches(metadata), 
+                )
         return event, metadata
     
     @roster_manager.decorate
@@ -61,10 +76,13 @@ class LogEvents:
         eventParam: tp_rt.RealtimeClientEventParam, 
         metadata: dict, _, 
     ) -> tuple[tp_rt.RealtimeClientEventParam, dict]:
-        if self.filter_client is None or self.filter_client(eventParam):
+        if (
+            (self.filter_client is None or self.filter_client(eventParam))
+            and self.logger.isEnabledFor(logging.DEBUG)
+        ):
             self.logger.debug(
-                f'Client: {self.str_client_event(eventParam)}\n'
-                f'eventParam {metadata = }', 
+                'Client: %s\neventParam metadata = %s', 
+                self.str_client_event(eventParam), metadata_omit_caches(metadata), 
             )
         return eventParam, metadata
 
@@ -16,17 +16,19 @@ class MetadataHandlerRosterManager:
         self.allow_same_handler_repeated = allow_same_handler_repeated
     
     def decorate(self, handler: F) -> F:
+        handler_name = self.handler_name    # fixed per manager; no attribute loads per event
+        allow_same_handler_repeated = self.allow_same_handler_repeated
+
         @functools.wraps(handler)
         def wrapper(
             self_, event, metadata: dict, connection, 
         ) -> tuple[tp.Any, dict]:
-            if HANDLER_ROSTER not in metadata:
-                metadata[HANDLER_ROSTER] = []
-            roster = metadata[HANDLER_ROSTER]
-            assert isinstance(roster, list)
-            if not self.allow_same_handler_repeated:
-                assert self.handler_name not in roster
-            roster.append(self.handler_name)
+            roster = metadata.setdefault(HANDLER_ROSTER, [])
+            if __debug__:
+                assert isinstance(roster, list)
+                if not allow_same_handler_repeated:
+                    assert handler_name not in roster
+            roster.append(handler_name)
             return handler(self_, event, metadata, connection)
         return tp.cast(F, wrapper)
     
@@ -1,22 +1,38 @@
 import typing as tp
-from base64 import b64encode
-import itertools
+from collections import deque
 import asyncio
 from contextlib import contextmanager
 import wave
-import audioop
+import queue
+import threading
 
 import pyaudio
 import openai.types.realtime as tp_rt
 from openai.types.realtime import realtime_audio_formats
 import websockets
+try:    # optional-dependency: fast-base64
+    from pybase64 import b64encode_as_string    # SIMD
+except ImportError:
+    from binascii import b2a_base64
+    def b64encode_as_string(s: bytes) -> str:
+        return b2a_base64(s, newline=False).decode('ascii')
 
 from .shared import MetadataHandlerRosterManager
 from ..audio_config import N_CHANNELS, ConfigSpecification, ConfigInfo, UnderSpecified
+from ..g711 import alaw2lin16, ulaw2lin16
 from ..niceness import NicenessManager, ThreadPriority
 
 PAYLOAD_SIZE_LIMIT = 15 * 1024 * 1024  # 15 MiB
-PAYLOAD_SIZE_THRESHOLD = round(PAYLOAD_SIZE_LIMIT * 0.9)
+# Raw audio bytes per send when backlogged (~2.7 s of 24 kHz PCM16). 
+# Small enough not to hold up the socket; base64 inflates it by 4/3.  
+PAYLOAD_SIZE_THRESHOLD = 128 * 1024
+assert PAYLOAD_SIZE_THRESHOLD * 4 // 3 < PAYLOAD_SIZE_LIMIT
+
+TO_LINEAR_PCM16: dict[type, tp.Callable[[bytes], bytes]] = {
+    realtime_audio_formats.AudioPCM : lambda data: data, 
+    realtime_audio_formats.AudioPCMA: alaw2lin16, 
+    realtime_audio_formats.AudioPCMU: ulaw2lin16, 
+}
 
 class StreamMic:
     '''
@@ -26,6 +42,8 @@ class StreamMic:
     to provide audio format and then opens stream. Otherwise, opens stream 
     immediately.  
     Can duplicate audio to a recording file.  
+    `linger_ms` > 0 trades that much latency for fewer, larger sends. 
+    Only useful if it exceeds the page duration. Default 0: send each page asap.  
     '''
 
     roster_manager = MetadataHandlerRosterManager('StreamMic')
@@ -36,20 +54,25 @@ class StreamMic:
         audio_config_specification: ConfigSpecification,
         input_device_index: int | None = None, 
         recording_path: str | None = None,
+        linger_ms: float = 0.0, 
     ):
         self.pa = pa
         self.audio_config_specification = audio_config_specification
         self.input_device_index = input_device_index
+        self.linger_ms = linger_ms
         self.config_info: ConfigInfo | None = None
         self.stream: pyaudio.Stream | None = None
         self._send_with_handlers: tp.Callable[
             [tp_rt.RealtimeClientEventParam], tp.Awaitable[None], 
         ] | None = None
-        self.event_id_iter = itertools.count()
+        self._n_events_sent = 0
         self.asyncio_loop = asyncio.get_event_loop()
-        self.buffer = asyncio.Queue[bytes]()
+        self.buffer: deque[bytes] = deque()  # PortAudio thread appends, worker poplefts
+        self._buffer_event = asyncio.Event()    # set soon after an append to an empty buffer
         self.niceness_manager = NicenessManager()
 
+        self._record_queue: queue.Queue[bytes | None] = queue.Queue()
+        self._record_thread: threading.Thread | None = None
         if recording_path is None:
             self._recording_file = None
         else:
@@ -84,6 +107,10 @@ class StreamMic:
         print(__class__.__name__ + ': stream opened.')
         if self._recording_file is not None:
             self._recording_file.setframerate(config_info.format_info.sample_rate)
+            self._record_thread = threading.Thread(
+                target=self.record_worker, name='StreamMic_recorder', daemon=True, 
+            )
+            self._record_thread.start()
         asyncio.create_task(self.worker(), name='StreamMic_worker')
     
     def _set_audio_config(self, from_server: tp_rt.RealtimeAudioFormats | None) -> ConfigInfo:
@@ -98,18 +125,21 @@ class StreamMic:
         return self.config_info
     
     def on_audio_in(self, in_data: bytes, frame_count, time_info, status):
-        self.niceness_manager.maybe_set(ThreadPriority.high)
-        self.asyncio_loop.call_soon_threadsafe( # preserves order
-            self.buffer.put_nowait, in_data,
-        )
+        if not self.niceness_manager.has_set:   # skip the call on every later page
+            self.niceness_manager.maybe_set(ThreadPriority.high)
+        self.buffer.append(in_data)     # GIL-atomic; deque preserves order
+        if len(self.buffer) == 1:   # was empty: the worker may be waiting. Else a wakeup is pending or it's draining.  
+            self.asyncio_loop.call_soon_threadsafe(self._buffer_event.set)
         return None, pyaudio.paContinue
     
     async def send_audio(self, data: bytes) -> None:
         assert self._send_with_handlers is not None
+        event_i = self._n_events_sent
+        self._n_events_sent = event_i + 1
         event = tp_rt.InputAudioBufferAppendEventParam(
             type = 'input_audio_buffer.append',
-            audio = b64encode(data).decode('ascii'),
-            event_id='client-a-' + str(next(self.event_id_iter)),
+            audio = b64encode_as_string(data),
+            event_id=f'client-a-{event_i}',
         )
         await self._send_with_handlers(event)
     
@@ -129,22 +159,47 @@ class StreamMic:
             _buf_size = 0
             return collated
         
+        def drain() -> None:
+            while self.buffer and _buf_size < PAYLOAD_SIZE_THRESHOLD:
+                append(self.buffer.popleft())
+
+        buffer_event = self._buffer_event
+        linger_s = self.linger_ms / 1000.0
         while self.stream is not None:
-            append(await self.buffer.get())
+            await buffer_event.wait()
+            buffer_event.clear()
+            if not self.buffer:
+                continue    # a set() from already-drained audio, or shutdown
+            deadline = self.asyncio_loop.time() + linger_s
+            drain()
             while _buf_size < PAYLOAD_SIZE_THRESHOLD:
+                timeout = deadline - self.asyncio_loop.time()
+                if timeout <= 0:
+                    break
                 try:
-                    append(self.buffer.get_nowait())
-                except asyncio.QueueEmpty:
+                    await asyncio.wait_for(buffer_event.wait(), timeout)
+                except TimeoutError:
                     break
+                buffer_event.clear()
+                drain()
+            if self.buffer:
+                buffer_event.set()  # leftover beyond threshold: next batch
             harvested = harvest()
             try:
                 await self.send_audio(harvested)
             except websockets.ConnectionClosedOK:
                 assert self.stream is None
                 return
-            if self._recording_file is not None:
-                processed = self._process_audio_chunk(harvested)
-                self._recording_file.writeframes(processed)
+            if self._record_thread is not None:
+                self._record_queue.put_nowait(harvested)
+    
+    def record_worker(self) -> None:
+        '''
+        Decode and disk write, off the event loop. Order is kept by the queue.  
+        '''
+        assert self._recording_file is not None
+        while (harvested := self._record_queue.get()) is not None:
+            self._recording_file.writeframes(self._process_audio_chunk(harvested))
 
     def _process_audio_chunk(self, data: bytes) -> bytes:
         """
@@ -152,15 +207,12 @@ class StreamMic:
         Passes through Linear PCM data as is.
         """
         assert self.config_info is not None
-        match self.config_info.format_info.format:
-            case realtime_audio_formats.AudioPCM():
-                return data
-            case realtime_audio_formats.AudioPCMA():
-                return audioop.alaw2lin(data, 2)
-            case realtime_audio_formats.AudioPCMU():
-                return audioop.ulaw2lin(data, 2)
-            case _:
-                raise ValueError(f'Unsupported audio format: {self.config_info.format_info.format}')
+        format = self.config_info.format_info.format
+        try:
+            to_linear_pcm16 = TO_LINEAR_PCM16[type(format)]
+        except KeyError:
+            raise ValueError(f'Unsupported audio format: {format}')
+        return to_linear_pcm16(data)
     
     @roster_manager.decorate
     def server_event_handler(
@@ -168,11 +220,15 @@ class StreamMic:
     ) -> tuple[tp_rt.RealtimeServerEvent, dict]:
         match event:
             case tp_rt.SessionUpdatedEvent():
-                assert isinstance(event.session, tp_rt.RealtimeSessionCreateRequest)
-                assert event.session.audio is not None
-                assert event.session.audio.input is not None
-                assert event.session.audio.input.format is not None
-                self._set_audio_config(event.session.audio.input.format)
+                session = event.session
+                assert isinstance(session, tp_rt.RealtimeSessionCreateRequest)
+                audio = session.audio
+                assert audio is not None
+                input = audio.input
+                assert input is not None
+                format = input.format
+                assert format is not None
+                self._set_audio_config(format)
                 self.maybe_open_stream()
         return event, metadata
 
@@ -196,7 +252,11 @@ class StreamMic:
                 self.stream.stop_stream()
                 self.stream.close()
                 self.stream = None
-            self.buffer.put_nowait(b'')  # unblock worker
+            self._buffer_event.set()  # unblock worker, which sees stream is None
+            if self._record_thread is not None:
+                self._record_queue.put_nowait(None)
+                self._record_thread.join()
+                self._record_thread = None
             if self._recording_file is not None:
                 self._recording_file.close()
                 self._recording_file = None
@@ -1,4 +1,5 @@
 import asyncio
+from collections import OrderedDict
 import typing as tp
 from contextlib import contextmanager
 
@@ -18,6 +19,8 @@ class ToolCallOnSpeechEnd:
 
     roster_manager = MetadataHandlerRosterManager('ToolCallOnSpeechEnd')
 
+    MAX_ENDED_ITEM_IDS = 1024   # tool call args arrive soon after the speech ends
+
     def __init__(
         self, 
         tool_call_handlers: list[
@@ -37,7 +40,7 @@ class ToolCallOnSpeechEnd:
         self._tool_calls_in_waiting = dict[tp.Annotated[
             str, 'item_id', 
         ], tp_rt.ResponseFunctionCallArgumentsDoneEvent]()
-        self.ended_item_ids = set[str]()
+        self.ended_item_ids = OrderedDict[str, None]()  # bounded, oldest first
     
     @contextmanager
     def context(self):
@@ -60,7 +63,9 @@ class ToolCallOnSpeechEnd:
         return event, metadata
     
     async def on_speech_end(self, item_id: str, content_index: int) -> None:
-        self.ended_item_ids.add(item_id)
+        self.ended_item_ids[item_id] = None
+        if len(self.ended_item_ids) > __class__.MAX_ENDED_ITEM_IDS:
+            self.ended_item_ids.popitem(last=False)
         try:
             event = self._tool_calls_in_waiting.pop(item_id)
         except KeyError:
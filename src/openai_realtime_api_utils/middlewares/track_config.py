@@ -1,7 +1,8 @@
 import openai.types.realtime as tp_rt
 
-from ..shared import parse_client_event_param
+from ..shared import parse_client_event_param_cachable
 from .shared import MetadataHandlerRosterManager
+from ..audio_config import FormatInfo as AudioFormatInfo
 
 class TrackConfig:
     '''
@@ -13,6 +14,7 @@ class TrackConfig:
       - To communicate this ambiguity downstream.  
     - `audio_format_input` and `audio_format_output` track the last known audio formats.  
       - Changing audio formats mid session is unrealistic.  
+    - `audio_format_output_info` is derived from `audio_format_output` on change.  
     '''
 
     roster_manager = MetadataHandlerRosterManager('TrackConfig')
@@ -21,6 +23,7 @@ class TrackConfig:
         self.session_config: tp_rt.RealtimeSessionCreateRequest | None = None
         self.audio_format_input : tp_rt.RealtimeAudioFormats | None = None
         self.audio_format_output: tp_rt.RealtimeAudioFormats | None = None
+        self.audio_format_output_info: AudioFormatInfo | None = None
 
     @roster_manager.decorate
     def server_event_handler(
@@ -38,7 +41,9 @@ class TrackConfig:
         self, event_param: tp_rt.RealtimeClientEventParam, 
         metadata: dict, _,
     ) -> tuple[tp_rt.RealtimeClientEventParam, dict]:
-        event = parse_client_event_param(event_param)
+        if event_param['type'] != 'session.update':
+            return event_param, metadata    # no need to parse
+        event = parse_client_event_param_cachable(event_param, metadata)
         if isinstance(event, tp_rt.SessionUpdateEvent):
             self.session_config = None
             assert isinstance(event.session, tp_rt.RealtimeSessionCreateRequest)
@@ -46,9 +51,25 @@ class TrackConfig:
         return event_param, metadata
 
     def _maybe_update_audio_formats(self, config: tp_rt.RealtimeSessionCreateRequest):
-        if config.audio is None:
+        audio = config.audio
+        if audio is None:
             return
-        if config.audio.input is not None:
-            self.audio_format_input  = config.audio.input.format
-        if config.audio.output is not None:
-            self.audio_format_output = config.audio.output.format
+        input, output = audio.input, audio.output
+        if input is not None:
+            self.audio_format_input  = input.format
+        if output is not None:
+            format = output.format
+            if format is not self.audio_format_output and format != self.audio_format_output:
+                self.audio_format_output_info = self._format_info_or_none(format)
+            self.audio_format_output = format
+    
+    @staticmethod
+    def _format_info_or_none(
+        format: tp_rt.RealtimeAudioFormats | None, 
+    ) -> AudioFormatInfo | None:
+        if format is None:
+            return None
+        try:
+            return AudioFormatInfo(format)
+        except ValueError:
+            return None     # unsupported; only matters to consumers of the info
@@ -1,22 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime
+from array import array
+from time import perf_counter_ns
 import typing as tp
-from copy import deepcopy
 from contextlib import suppress
 import json
 
 import uuid
 import openai.types.realtime as tp_rt
+from openai.types.realtime.realtime_conversation_item_assistant_message import Content as ContentAssistent
 
 from ..shared import (
-    str_item_omit_audio, parse_client_event_param, 
+    str_item_omit_audio, parse_client_event_param_cachable, 
     item_from_param, PART_TO_CONTENT_TYPE, 
     merge_content_parts_transcript, 
 )
 from .shared import MetadataHandlerRosterManager
 from ..conversation_group import ConversationGroup
-from ..b64_decode_cachable import b64_decode_cachable
+from ..b64_decode_cachable import b64_decoded_len_cachable
 
 class TrackConversation:
     '''
@@ -39,8 +41,11 @@ class TrackConversation:
       - user input audio transcription;  
       - assistant text;  
       - assistant audio transcript.  
+      - Chunks are joined lazily, whenever `all_items` or `get_item()` is read.  
     - Slowly synced, disregarding delta:  
       - assistant tool call.  
+    - `paranoid`: deep-compare tracked items against the server's copy on 
+      every item lifecycle event. O(item size), so off by default.  
     '''
 
     roster_manager = MetadataHandlerRosterManager('TrackConversation')
@@ -70,8 +75,8 @@ class TrackConversation:
                     assert item_id is not None
                     assert item_id not in self.locally_synced_awaiting_server_confirmation
                     self.locally_synced_awaiting_server_confirmation.add(item_id)
-                    assert item_id not in self.parent.all_items
-                    self.parent.all_items[item_id] = item_from_param(item_param)
+                    assert item_id not in self.parent._all_items
+                    self.parent._all_items[item_id] = item_from_param(item_param)
                     self.parent.conversation_group.insert_after(
                         ConversationGroup.Cell(item_id=item_id), 
                         previous_item_id, 
@@ -82,10 +87,10 @@ class TrackConversation:
                 case tp_rt.ResponseOutputItemAddedEvent() as event:
                     item_id = event.item.id
                     assert item_id is not None
-                    assert item_id not in self.parent.all_items
+                    assert item_id not in self.parent._all_items
                     response = self.parent.responses[event.response_id]
                     if response.conversation_id is None:
-                        self.parent.all_items[item_id] = event.item
+                        self.parent._all_items[item_id] = event.item
                         self.parent.conversation_group.safe_add_oob(
                             ConversationGroup.Cell(
                                 item_id=item_id,
@@ -96,8 +101,8 @@ class TrackConversation:
                     else:
                         assert item_id not in self.response_added_awaiting_conversation_insertion
                         self.response_added_awaiting_conversation_insertion[item_id] = event.response_id
-                        assert item_id not in self.parent.all_items
-                        self.parent.all_items[item_id] = event.item
+                        assert item_id not in self.parent._all_items
+                        self.parent._all_items[item_id] = event.item
                 case tp_rt.ConversationItemAdded() as event:
                     item_id = event.item.id
                     assert item_id is not None
@@ -116,24 +121,28 @@ class TrackConversation:
                         is_added_by_response = True
                     assert not (is_locally_synced and is_added_by_response)
                     if is_locally_synced:
-                        assert item_id in self.parent.all_items
-                        old_item = self.parent.all_items[item_id]
+                        assert item_id in self.parent._all_items
+                        old_item = self.parent._all_items[item_id]
                         old_item.status = event.item.status  # type: ignore
-                        assert old_item == event.item, (
-                            'I just thought the ConversationItemAdded after the ConversationItemCreateEvent would have identical item.',
-                            old_item, event.item, 
-                        )
+                        assert old_item.type == event.item.type, (old_item, event.item)
+                        if __debug__ and self.parent.paranoid:
+                            assert old_item == event.item, (
+                                'I just thought the ConversationItemAdded after the ConversationItemCreateEvent would have identical item.',
+                                old_item, event.item, 
+                            )
                         self.parent.conversation_group.move(
                             item_id, event.previous_item_id, 
                         )
                         self.parent.conversation_group.touch(item_id, event.event_id)
                     elif is_added_by_response:
-                        assert item_id in self.parent.all_items
-                        dangling_item = self.parent.all_items[item_id]
-                        assert dangling_item == event.item, (
-                            'I just thought the ConversationItemAdded after the ResponseOutputItemAddedEvent would have identical item.', 
-                            dangling_item, event.item,
-                        )
+                        assert item_id in self.parent._all_items
+                        dangling_item = self.parent._all_items[item_id]
+                        assert dangling_item.type == event.item.type, (dangling_item, event.item)
+                        if __debug__ and self.parent.paranoid:
+                            assert dangling_item == event.item, (
+                                'I just thought the ConversationItemAdded after the ResponseOutputItemAddedEvent would have identical item.', 
+                                dangling_item, event.item,
+                            )
                         assert response_id is not None
                         self.parent.conversation_group.insert_after(
                             ConversationGroup.Cell(
@@ -144,164 +153,285 @@ class TrackConversation:
                         )
                         self.parent.conversation_group.touch(item_id, event.event_id)
                     else:
-                        assert item_id not in self.parent.all_items
-                        self.parent.all_items[item_id] = event.item
+                        assert item_id not in self.parent._all_items
+                        self.parent._all_items[item_id] = event.item
                         self.parent.conversation_group.insert_after(
                             ConversationGroup.Cell(item_id=item_id), 
                             event.previous_item_id, 
                         )
                         self.parent.conversation_group.touch(item_id, event.event_id)
 
-    def __init__(self):
+    def __init__(self, paranoid: bool = False):
+        self.paranoid = paranoid
         self.conversation_group = ConversationGroup()
-        self.all_items: dict[
+        self._touch = self.conversation_group.touch    # bound once for the delta handlers
+        self._all_items: dict[
             str, tp_rt.ConversationItem, 
         ] = {}  # main conversation and OOB; no trash
         self.responses: dict[
             str, tp_rt.RealtimeResponse, 
         ] = {}
-        self.server_events: dict[str, tuple[
-            tp_rt.RealtimeServerEvent, datetime, 
-        ]] = {}
-        self.client_events: dict[str, tuple[
-            tp_rt.RealtimeClientEventParam, datetime, 
-        ]] = {}
+        # Event log, struct-of-arrays: no per-event tuple or int object.  
+        self.events: list[
+            tp_rt.RealtimeServerEvent | tp_rt.RealtimeClientEventParam
+        ] = []  # client events are the (dict) params
+        self.events_ns = array('q')  # ns since init_time
+        self.event_index: dict[str, int] = {}   # event_id -> position in the above
         self.impatience = __class__.Impatience(self)
+        self._pending_deltas: dict[
+            str, # item_id
+            dict[tuple[int, str], list[str]], # (content_index, field) -> chunks
+        ] = {}
         self.init_time = datetime.now()
+        self._init_perf_ns = perf_counter_ns()
+        self._server_event_dispatch: dict[type, tp.Callable[[tp.Any, dict], None]] = {
+            # High-rate deltas first. Order is cosmetic; lookup is O(1).
+            tp_rt.ResponseAudioDeltaEvent                                : self._on_audio_delta_event,
+            tp_rt.ResponseAudioTranscriptDeltaEvent                      : self._on_audio_transcript_delta_event,
+            tp_rt.ResponseTextDeltaEvent                                 : self._on_text_delta_event,
+            tp_rt.ConversationItemInputAudioTranscriptionDeltaEvent      : self._on_input_audio_transcription_delta_event,
+            tp_rt.ConversationItemCreatedEvent                           : self._on_item_created_event,
+            tp_rt.ConversationItemAdded                                  : self._on_item_added_event,
+            tp_rt.ConversationItemDone                                   : self._on_item_done_event,
+            tp_rt.ResponseOutputItemDoneEvent                            : self._on_item_done_event,
+            # ConversationItemRetrieved: ufortunately contains less info than can be inferred from client side.
+            tp_rt.ConversationItemInputAudioTranscriptionCompletedEvent  : self._on_input_audio_transcription_completed_event,
+            tp_rt.ConversationItemInputAudioTranscriptionFailedEvent     : self._on_input_audio_transcription_failed_event,
+            tp_rt.ConversationItemTruncatedEvent                         : self._on_item_truncated_event,
+            tp_rt.ConversationItemDeletedEvent                           : self._on_item_deleted_event,
+            tp_rt.ResponseCreatedEvent                                   : self._on_response_created_event,
+            tp_rt.ResponseOutputItemAddedEvent                           : self._on_output_item_added_event,
+            tp_rt.ResponseContentPartAddedEvent                          : self._on_content_part_added_event,
+            tp_rt.ResponseContentPartDoneEvent                           : self._on_content_part_done_event,
+            tp_rt.ResponseDoneEvent                                      : self._on_response_done_event,
+        }
 
+    def _log_event(
+        self, event_id: str, 
+        event: tp_rt.RealtimeServerEvent | tp_rt.RealtimeClientEventParam, 
+    ) -> None:
+        self.event_index[event_id] = len(self.events)
+        self.events.append(event)
+        self.events_ns.append(perf_counter_ns() - self._init_perf_ns)
+    
     @roster_manager.decorate
     def server_event_handler(
         self, event: tp_rt.RealtimeServerEvent, metadata: dict, _,
     ) -> tuple[tp_rt.RealtimeServerEvent, dict]:
-        self.server_events[event.event_id] = (event, datetime.now())
-        match event:
-            case tp_rt.ConversationItemCreatedEvent():
-                raise RuntimeError('Beta API signature detected. Hint: are you a time traveler?')
-            case tp_rt.ConversationItemAdded(item=item):
-                self.impatience.handle(event)
-            case (
-                tp_rt.ConversationItemDone(item=item) |
-                tp_rt.ResponseOutputItemDoneEvent(item=item)
-            ):
-                assert item.id is not None
-                old_item = self.all_items[item.id]
-                # What may differ >>>>
-                with suppress(AttributeError):
-                    old_item.status    = item.status     # type: ignore
-                with suppress(AttributeError):
-                    old_item.arguments = item.arguments  # type: ignore
-                # <<<<
-                assert old_item == item, (old_item, item)
-                self.conversation_group.touch(item.id, event.event_id)
-            # case ConversationItemRetrieved(item=item):    # ufortunately contains less info than can be inferred from client side.  
-            #     assert item.id is not None
-            #     assert item.id in self.all_items
-            #     self.all_items[item.id] = item
-            #     self.conversation_group.touch(item.id, event.event_id)
-            case tp_rt.ConversationItemInputAudioTranscriptionCompletedEvent():
-                item = self.all_items[event.item_id]
-                assert isinstance(item, tp_rt.RealtimeConversationItemUserMessage)
-                old_part = item.content[event.content_index]
-                old_part.transcript = event.transcript
-                self.conversation_group.touch(event.item_id, event.event_id)
-            case tp_rt.ConversationItemInputAudioTranscriptionDeltaEvent():
-                if event.delta:
-                    item = self.all_items[event.item_id]
-                    assert isinstance(item, tp_rt.RealtimeConversationItemUserMessage)
-                    assert event.content_index is not None
-                    old_part = item.content[event.content_index]
-                    if old_part.transcript is None:
-                        old_part.transcript = event.delta
-                    else:
-                        old_part.transcript += event.delta
-                self.conversation_group.touch(event.item_id, event.event_id)
-            case tp_rt.ConversationItemInputAudioTranscriptionFailedEvent():
-                item = self.all_items[event.item_id]
-                assert isinstance(item, tp_rt.RealtimeConversationItemUserMessage)
-                old_part = item.content[event.content_index]
-                old_part.transcript = str(event.error)
-                self.conversation_group.touch(event.item_id, event.event_id)
-            case tp_rt.ConversationItemTruncatedEvent():
-                cell = self.conversation_group.get_cell_from_id(event.item_id)
-                if cell.truncate_info is None:
-                    # Unreachable?
-                    cell.truncate_info = (
-                        event.content_index, event.audio_end_ms, None, 
-                    )
-                self.conversation_group.touch(event.item_id, event.event_id)
-            case tp_rt.ConversationItemDeletedEvent():
-                self.conversation_group.touch(event.item_id, event.event_id)
-                self.conversation_group.trash(event.item_id)
-            case tp_rt.ResponseTextDeltaEvent():
-                item = self.all_items[event.item_id]
-                assert isinstance(item, tp_rt.RealtimeConversationItemAssistantMessage)
-                content = item.content[event.content_index]
-                if content.text is None:
-                    content.text = event.delta
-                else:
-                    content.text += event.delta
-                self.conversation_group.touch(event.item_id, event.event_id)
-            case tp_rt.ResponseAudioTranscriptDeltaEvent():
-                item = self.all_items[event.item_id]
-                assert isinstance(item, tp_rt.RealtimeConversationItemAssistantMessage)
-                content = item.content[event.content_index]
-                if content.transcript is None:
-                    content.transcript = event.delta
-                else:
-                    content.transcript += event.delta
-                self.conversation_group.touch(event.item_id, event.event_id)
-            case tp_rt.ResponseAudioDeltaEvent():
-                n_new_bytes = len(b64_decode_cachable(event, metadata))
-                cell = self.conversation_group.get_cell_from_id(event.item_id)
-                cell.audio_total_bytes += n_new_bytes
-                self.conversation_group.touch(event.item_id, event.event_id)
-            case tp_rt.ResponseCreatedEvent(response=response):
-                # Openai doesn't give us the main conversation ID.  
-                # Hence the following assert.  
-                # Thanks to the assert, assume non-None id to mean main conversation.  
-                if response.conversation_id is not None:
-                    self.conversation_group.assert_main_conversation_id(
-                        response.conversation_id,
-                    )
-                assert response.id is not None
-                assert response.id not in self.responses
-                self.responses[response.id] = response
-            case tp_rt.ResponseOutputItemAddedEvent():
-                self.impatience.handle(event)
-            case tp_rt.ResponseContentPartAddedEvent():
-                item = self.all_items[event.item_id]
-                assert isinstance(item, (
-                    tp_rt.RealtimeConversationItemAssistantMessage, 
-                    # tp_rt.RealtimeConversationItemFunctionCall, 
-                ))
-                assert len(item.content) == event.content_index
-                item.content.append(tp_rt.realtime_conversation_item_assistant_message.Content(
-                    audio=event.part.audio,
-                    text=event.part.text,
-                    transcript=event.part.transcript,
-                    type=PART_TO_CONTENT_TYPE[
-                        event.part.type
-                    ] if event.part.type is not None else None,
-                ))
-                assert self.conversation_group.get_cell_from_id(
-                    event.item_id,
-                ).response_id == event.response_id
-            case tp_rt.ResponseContentPartDoneEvent():
-                item = self.all_items[event.item_id]
-                assert isinstance(item, (
-                    tp_rt.RealtimeConversationItemAssistantMessage, 
-                    # tp_rt.RealtimeConversationItemFunctionCall, 
-                ))
-                assert len(item.content) > event.content_index
-                assert self.conversation_group.get_cell_from_id(
-                    event.item_id,
-                ).response_id == event.response_id
-            case tp_rt.ResponseDoneEvent(response=response):
-                assert response.id is not None
-                assert response.id in self.responses
-                self.responses[response.id] = response
+        # type dispatch: one dict lookup instead of a `match` ladder per event
+        handler = self._server_event_dispatch.get(type(event))
+        if handler is None:
+            return event, metadata  # ignored types are not logged either
+        self._log_event(event.event_id, event)
+        handler(event, metadata)
         return event, metadata
     
+    def _on_audio_delta_event(
+        self, event: tp_rt.ResponseAudioDeltaEvent, metadata: dict, 
+    ) -> None:
+        n_new_bytes = b64_decoded_len_cachable(event, metadata)
+        cell = self.conversation_group.get_cell_from_id(event.item_id)
+        cell.audio_total_bytes += n_new_bytes
+        cell.touched_by_event_ids.append(event.event_id)   # touch() minus the re-lookup
+    
+    def _on_audio_transcript_delta_event(
+        self, event: tp_rt.ResponseAudioTranscriptDeltaEvent, metadata: dict, 
+    ) -> None:
+        self._append_delta(
+            event.item_id, event.content_index, 'transcript', event.delta, 
+            tp_rt.RealtimeConversationItemAssistantMessage, 
+        )
+        self._touch(event.item_id, event.event_id)
+    
+    def _on_text_delta_event(
+        self, event: tp_rt.ResponseTextDeltaEvent, metadata: dict, 
+    ) -> None:
+        self._append_delta(
+            event.item_id, event.content_index, 'text', event.delta, 
+            tp_rt.RealtimeConversationItemAssistantMessage, 
+        )
+        self._touch(event.item_id, event.event_id)
+    
+    def _on_input_audio_transcription_delta_event(
+        self, event: tp_rt.ConversationItemInputAudioTranscriptionDeltaEvent, metadata: dict, 
+    ) -> None:
+        if event.delta:
+            assert event.content_index is not None
+            self._append_delta(
+                event.item_id, event.content_index, 'transcript', event.delta, 
+                tp_rt.RealtimeConversationItemUserMessage, 
+            )
+        self._touch(event.item_id, event.event_id)
+    
+    def _append_delta(
+        self, item_id: str, content_index: int, field: str, delta: str, 
+        item_type: type, 
+    ) -> None:
+        '''
+        O(1) per delta: chunks are joined once, by `_flush_deltas`, 
+        instead of `str +=` re-copying the whole text every time.  
+        '''
+        chunks_of_item = self._pending_deltas.get(item_id)
+        if chunks_of_item is None:
+            chunks_of_item = self._pending_deltas[item_id] = {}
+        chunks = chunks_of_item.get((content_index, field))
+        if chunks is not None:
+            chunks.append(delta)
+            return
+        item = self._all_items[item_id]
+        assert isinstance(item, item_type)
+        old = getattr(item.content[content_index], field)   # type: ignore
+        chunks_of_item[(content_index, field)] = [delta] if old is None else [old, delta]
+    
+    def _flush_deltas(self, item_id: str) -> None:
+        chunks_of_item = self._pending_deltas.pop(item_id, None)
+        if chunks_of_item is None:
+            return
+        content = self._all_items[item_id].content    # type: ignore
+        for (content_index, field), chunks in chunks_of_item.items():
+            setattr(content[content_index], field, ''.join(chunks))
+    
+    @property
+    def all_items(self) -> dict[str, tp_rt.ConversationItem]:
+        '''
+        Main conversation and OOB items; no trash.  
+        Streamed text/transcript is brought up to date on every read.  
+        '''
+        for item_id in [*self._pending_deltas]:
+            self._flush_deltas(item_id)
+        return self._all_items
+    
+    def get_item(self, item_id: str) -> tp_rt.ConversationItem:
+        '''
+        `all_items[item_id]`, flushing only that item.  
+        '''
+        self._flush_deltas(item_id)
+        return self._all_items[item_id]
+    
+    def _on_item_created_event(
+        self, event: tp_rt.ConversationItemCreatedEvent, metadata: dict, 
+    ) -> None:
+        raise RuntimeError('Beta API signature detected. Hint: are you a time traveler?')
+    
+    def _on_item_added_event(
+        self, event: tp_rt.ConversationItemAdded, metadata: dict, 
+    ) -> None:
+        self.impatience.handle(event)
+    
+    def _on_item_done_event(
+        self, event: tp_rt.ConversationItemDone | tp_rt.ResponseOutputItemDoneEvent, metadata: dict, 
+    ) -> None:
+        item = event.item
+        assert item.id is not None
+        old_item = self.get_item(item.id)
+        # What may differ >>>>
+        with suppress(AttributeError):
+            old_item.status    = item.status     # type: ignore
+        with suppress(AttributeError):
+            old_item.arguments = item.arguments  # type: ignore
+        # <<<<
+        assert old_item.type == item.type, (old_item, item)
+        if __debug__ and self.paranoid:
+            assert old_item == item, (old_item, item)
+        self._touch(item.id, event.event_id)
+    
+    def _on_input_audio_transcription_completed_event(
+        self, event: tp_rt.ConversationItemInputAudioTranscriptionCompletedEvent, metadata: dict, 
+    ) -> None:
+        item = self.get_item(event.item_id)
+        assert isinstance(item, tp_rt.RealtimeConversationItemUserMessage)
+        old_part = item.content[event.content_index]
+        old_part.transcript = event.transcript
+        self._touch(event.item_id, event.event_id)
+    
+    def _on_input_audio_transcription_failed_event(
+        self, event: tp_rt.ConversationItemInputAudioTranscriptionFailedEvent, metadata: dict, 
+    ) -> None:
+        item = self.get_item(event.item_id)
+        assert isinstance(item, tp_rt.RealtimeConversationItemUserMessage)
+        old_part = item.content[event.content_index]
+        old_part.transcript = str(event.error)
+        self._touch(event.item_id, event.event_id)
+    
+    def _on_item_truncated_event(
+        self, event: tp_rt.ConversationItemTruncatedEvent, metadata: dict, 
+    ) -> None:
+        cell = self.conversation_group.get_cell_from_id(event.item_id)
+        if cell.truncate_info is None:
+            # Unreachable?
+            cell.truncate_info = (
+                event.content_index, event.audio_end_ms, None, 
+            )
+        cell.touched_by_event_ids.append(event.event_id)
+    
+    def _on_item_deleted_event(
+        self, event: tp_rt.ConversationItemDeletedEvent, metadata: dict, 
+    ) -> None:
+        self._touch(event.item_id, event.event_id)
+        self.conversation_group.trash(event.item_id)
+        self._flush_deltas(event.item_id)
+    
+    def _on_response_created_event(
+        self, event: tp_rt.ResponseCreatedEvent, metadata: dict, 
+    ) -> None:
+        response = event.response
+        # Openai doesn't give us the main conversation ID.  
+        # Hence the following assert.  
+        # Thanks to the assert, assume non-None id to mean main conversation.  
+        if response.conversation_id is not None:
+            self.conversation_group.assert_main_conversation_id(
+                response.conversation_id,
+            )
+        assert response.id is not None
+        assert response.id not in self.responses
+        self.responses[response.id] = response
+    
+    def _on_output_item_added_event(
+        self, event: tp_rt.ResponseOutputItemAddedEvent, metadata: dict, 
+    ) -> None:
+        self.impatience.handle(event)
+    
+    def _on_content_part_added_event(
+        self, event: tp_rt.ResponseContentPartAddedEvent, metadata: dict, 
+    ) -> None:
+        item = self._all_items[event.item_id]
+        assert isinstance(item, (
+            tp_rt.RealtimeConversationItemAssistantMessage, 
+            # tp_rt.RealtimeConversationItemFunctionCall, 
+        ))
+        assert len(item.content) == event.content_index
+        part = event.part
+        item.content.append(ContentAssistent(
+            audio=part.audio,
+            text=part.text,
+            transcript=part.transcript,
+            type=PART_TO_CONTENT_TYPE.get(part.type),   # type: ignore  # None -> None
+        ))
+        assert self.conversation_group.get_cell_from_id(
+            event.item_id,
+        ).response_id == event.response_id
+    
+    def _on_content_part_done_event(
+        self, event: tp_rt.ResponseContentPartDoneEvent, metadata: dict, 
+    ) -> None:
+        item = self.get_item(event.item_id)
+        assert isinstance(item, (
+            tp_rt.RealtimeConversationItemAssistantMessage, 
+            # tp_rt.RealtimeConversationItemFunctionCall, 
+        ))
+        assert len(item.content) > event.content_index
+        assert self.conversation_group.get_cell_from_id(
+            event.item_id,
+        ).response_id == event.response_id
+    
+    def _on_response_done_event(
+        self, event: tp_rt.ResponseDoneEvent, metadata: dict, 
+    ) -> None:
+        response = event.response
+        assert response.id is not None
+        assert response.id in self.responses
+        self.responses[response.id] = response
+    
     @roster_manager.decorate
     def client_event_handler(
         self, event_param: tp_rt.RealtimeClientEventParam, 
@@ -309,8 +439,8 @@ class TrackConversation:
     ) -> tuple[tp_rt.RealtimeClientEventParam, dict]:
         event_id = event_param.get('event_id', None)
         if event_id is not None:
-            self.client_events[event_id] = (event_param, datetime.now())
-        event = parse_client_event_param(event_param)
+            self._log_event(event_id, event_param)
+        event = parse_client_event_param_cachable(event_param, metadata)
         match event:
             case tp_rt.ConversationItemCreateEvent():
                 event_param = tp.cast(
@@ -319,13 +449,17 @@ class TrackConversation:
                 item_id = event_param['item'].get(
                     'id', None, 
                 ) or f'client-set-{uuid.uuid4()}'[:31]
-                previous_item_id = event_param.get(
-                    'previous_item_id', 
-                    self.conversation_group.last_item_id(), 
-                )
-                e_p = deepcopy(event_param)
-                e_p['item']['id'] = item_id
-                e_p['previous_item_id'] = previous_item_id
+                try:
+                    previous_item_id = event_param['previous_item_id']
+                except KeyError:
+                    previous_item_id = self.conversation_group.last_item_id()
+                # Shallow: only these two keys change, and the content 
+                # (possibly base64 audio) is only read by item_from_param.  
+                e_p: tp_rt.ConversationItemCreateEventParam = {
+                    **event_param, 
+                    'item': {**event_param['item'], 'id': item_id},   # type: ignore
+                    'previous_item_id': previous_item_id, 
+                }
                 self.impatience.handle(e_p)
                 return e_p, metadata
         return event_param, metadata
@@ -335,7 +469,7 @@ class TrackConversation:
         verbose: bool,
         print_fn: tp.Callable, 
     ):
-        item = self.all_items[cell.item_id]
+        item = self.get_item(cell.item_id)
         if verbose:
             print_fn('current state:')
             print_fn(f'  {str_item_omit_audio(item)}')
@@ -350,14 +484,13 @@ class TrackConversation:
                 if event_id is None:
                     print_fn('  <unindexed client event>')
                     continue
-                try:
-                    event,       datetime_ = self.server_events[event_id]
-                except KeyError:
-                    event_param, datetime_ = self.client_events[event_id]
-                    str_event = event_param['type']
+                event_i = self.event_index[event_id]
+                event = self.events[event_i]
+                if isinstance(event, dict):
+                    str_event = event['type']
                 else:
                     str_event = type(event).__name__
-                dt = (datetime_ - self.init_time).total_seconds()
+                dt = self.events_ns[event_i] * 1e-9
                 print_fn(f'  [{dt:5.1f}] {event_id:28s} {str_event}')
         else:
             match item:
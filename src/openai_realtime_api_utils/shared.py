@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import json
 import logging
 import typing as tp
 from contextlib import contextmanager
@@ -9,7 +11,15 @@ from openai.types.realtime.realtime_server_event import ConversationItemRetrieve
 from openai.types.realtime.realtime_conversation_item_user_message      import Content as ContentUser
 from openai.types.realtime.realtime_conversation_item_assistant_message import Content as ContentAssistent
 from openai.resources.realtime.realtime import AsyncRealtimeConnection
+from openai.types.websocket_connection_options import WebsocketConnectionOptions
 from openai._models import construct_type_unchecked
+try:    # optional-dependency: fast-json
+    from orjson import loads as json_loads, dumps as _orjson_dumps
+    def json_dumps(obj: tp.Any) -> str:
+        return _orjson_dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
 
 class L:
     '''
@@ -17,6 +27,13 @@ class L:
     '''
     root = 'root'
 
+# Pass to `AsyncRealtime.connect(websocket_connection_options=...)`.  
+# Realtime traffic is mostly base64 audio, which permessage-deflate barely shrinks 
+# at a per-frame zlib CPU cost. Re-enable for text-only sessions if bandwidth matters.  
+WEBSOCKET_CONNECTION_OPTIONS: WebsocketConnectionOptions = {
+    'compression': None, 
+}
+
 ServerEventHandler = tp.Callable[
     [tp_rt.RealtimeServerEvent, dict, AsyncRealtimeConnection], 
     tuple[tp_rt.RealtimeServerEvent | None, dict], 
@@ -44,6 +61,45 @@ def parse_client_event_param(
         )
     )
 
+# High-rate event types are constructed directly, skipping union discrimination.  
+HIGH_RATE_SERVER_EVENT_TYPES: dict[str, type[tp_rt.RealtimeServerEvent]] = {
+    'response.output_audio.delta': tp_rt.ResponseAudioDeltaEvent, 
+    'response.output_audio_transcript.delta': tp_rt.ResponseAudioTranscriptDeltaEvent, 
+    'response.output_text.delta': tp_rt.ResponseTextDeltaEvent, 
+    'conversation.item.input_audio_transcription.delta': tp_rt.ConversationItemInputAudioTranscriptionDeltaEvent, 
+}
+
+CLIENT_EVENT_CACHE_KEY = 'parsed_client_event_cache'
+
+def parse_client_event_param_cachable(
+    event_param: tp_rt.RealtimeClientEventParam, metadata: dict, 
+) -> tp_rt.RealtimeClientEvent:
+    '''
+    Parse, caching the result in metadata so that each client event is parsed once 
+    across middlewares. Invalidated if an upstream handler replaced `event_param`.  
+    '''
+    cached = metadata.get(CLIENT_EVENT_CACHE_KEY)
+    if cached is not None and cached[0] is event_param:
+        return cached[1]
+    event = parse_client_event_param(event_param)
+    metadata[CLIENT_EVENT_CACHE_KEY] = (event_param, event)
+    return event
+
+def parse_server_event(data: str | bytes) -> tp_rt.RealtimeServerEvent:
+    '''
+    Same as `AsyncRealtimeConnection.parse_event`, but uses orjson if installed 
+    and fast-paths `HIGH_RATE_SERVER_EVENT_TYPES`.  
+    '''
+    value = json_loads(data)
+    return tp.cast(
+        tp_rt.RealtimeServerEvent, construct_type_unchecked(
+            value=value, 
+            type_=tp.cast(tp.Any, HIGH_RATE_SERVER_EVENT_TYPES.get(
+                value.get('type'), tp_rt.RealtimeServerEvent, 
+            )), 
+        )
+    )
+
 @contextmanager
 def hook_handlers(
     connection: AsyncRealtimeConnection, 
@@ -53,15 +109,20 @@ def hook_handlers(
     tp.Callable[[], tp.Coroutine[tp.Any, tp.Any, None]], 
     tp.Callable[[tp_rt.RealtimeClientEventParam], tp.Coroutine[tp.Any, tp.Any, None]], 
 ], None, None]:
+    # Snapshot once; the per-event loops below iterate these.  
+    s_handlers = tuple(server_event_handlers)
+    c_handlers = tuple(client_event_handlers)
+
     async def keep_receiving():
         while True:
             try:
-                event = await connection.recv()
+                data = await connection.recv_bytes()
             except websockets.exceptions.ConnectionClosedOK:
                 print('WebSocket connection closed normally')
                 return
+            event = parse_server_event(data)
             metadata = {}
-            for sHandler in server_event_handlers:
+            for sHandler in s_handlers:
                 maybe_event, metadata = sHandler(event, metadata, connection)
                 if maybe_event is None:
                     break
@@ -69,7 +130,7 @@ def hook_handlers(
     
     async def send(event: tp_rt.RealtimeClientEventParam) -> None:
         metadata = {}
-        for cHandler in client_event_handlers:
+        for cHandler in c_handlers:
             maybe_event, metadata = cHandler(event, metadata, connection)
             if maybe_event is None:
                 break
@@ -78,6 +139,18 @@ def hook_handlers(
     
     yield keep_receiving, send
 
+T = tp.TypeVar('T')
+
+def asyncio_run(main: tp.Coroutine[tp.Any, tp.Any, T]) -> T:
+    '''
+    `asyncio.run`, but on uvloop if installed (optional-dependency: fast-loop).  
+    '''
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
 def pages_of(
     signal: bytes, n_bytes_per_page: int, 
 ):
@@ -113,7 +186,7 @@ def item_with_audio_omitted(item: tp_rt.ConversationItem) -> tp_rt.ConversationI
         case _:
             return item
 
-def str_server_event_omit_audio(event: tp_rt.RealtimeServerEvent) -> str:
+def server_event_omit_audio(event: tp_rt.RealtimeServerEvent) -> tp_rt.RealtimeServerEvent:
     match event:
         case tp_rt.ResponseAudioDeltaEvent():
             e = event.model_copy(update=dict(
@@ -125,18 +198,36 @@ def str_server_event_omit_audio(event: tp_rt.RealtimeServerEvent) -> str:
             ))
         case _:
             e = event
-    return str(e)
+    return e
+
+def client_event_param_omit_audio(
+    eventParam: tp_rt.RealtimeClientEventParam, 
+) -> tp_rt.RealtimeClientEventParam:
+    # The type tag suffices; no need to parse the whole event.  
+    if eventParam['type'] == 'input_audio_buffer.append':
+        eventParam_ = tp.cast(tp_rt.InputAudioBufferAppendEventParam, eventParam)
+        eP = eventParam_.copy()
+        eP['audio'] = omit_audio(eP['audio'])
+        return eP
+    return eventParam
+
+def str_server_event_omit_audio(event: tp_rt.RealtimeServerEvent) -> str:
+    return str(server_event_omit_audio(event))
 
 def str_client_event_omit_audio(eventParam: tp_rt.RealtimeClientEventParam) -> str:
-    event = parse_client_event_param(eventParam)
-    match event:
-        case tp_rt.InputAudioBufferAppendEvent():
-            eventParam_ = tp.cast(tp_rt.InputAudioBufferAppendEventParam, eventParam)
-            eP = eventParam_.copy()
-            eP['audio'] = omit_audio(eP['audio'])
-        case _:
-            eP = eventParam
-    return str(eP)
+    return str(client_event_param_omit_audio(eventParam))
+
+def json_server_event_omit_audio(event: tp_rt.RealtimeServerEvent) -> str:
+    '''
+    Alternative to `str_server_event_omit_audio`. Serialized by pydantic-core.  
+    '''
+    return server_event_omit_audio(event).model_dump_json(exclude_unset=True)
+
+def json_client_event_omit_audio(eventParam: tp_rt.RealtimeClientEventParam) -> str:
+    '''
+    Alternative to `str_client_event_omit_audio`. orjson if installed.  
+    '''
+    return json_dumps(client_event_param_omit_audio(eventParam))
 
 def str_item_omit_audio(item: tp_rt.ConversationItem) -> str:
     return str(item_with_audio_omitted(item))
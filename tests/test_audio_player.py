@@ -0,0 +1,96 @@
+# pytest tests for AudioPlayer's callback finishing and interrupting speeches.
+
+import asyncio
+import pytest
+
+pytest.importorskip('pyaudio')
+pytest.importorskip('agents')
+
+from openai_realtime_api_utils.audio_config import EXAMPLE_SPECIFICATION
+from openai_realtime_api_utils.middlewares.audio_player import AudioPlayer, Buffer, Speech
+
+from test_audio_player_buffer import config_info
+
+def make_audio_player() -> AudioPlayer:
+    audio_player = AudioPlayer(None, EXAMPLE_SPECIFICATION)  # type: ignore
+    audio_player.config_info = config_info()
+    audio_player.pyaudio_niceness_manager.has_set = True
+    return audio_player
+
+def add_speech(audio_player: AudioPlayer, item_id: str, n_bytes: int | None = None) -> Speech:
+    speech = Speech(item_id=item_id, content_index=0, buffer=Buffer(config_info()))
+    audio_player._speech_index[(item_id, 0)] = speech
+    audio_player.speeches.append(speech)
+    speech.buffer.append(b'\x01' * (n_bytes or config_info().n_bytes_per_page))
+    speech.buffer.flush()
+    speech.has_more_to_come = False
+    return speech
+
+def on_audio_out(audio_player: AudioPlayer) -> bytes:
+    data, _ = audio_player.on_audio_out(None, 0, None, None)
+    return data
+
+def test_no_speech_end_after_interrupt():
+    ended: list[str] = []
+
+    async def on_speech_end(item_id: str, content_index: int):
+        ended.append(item_id)
+
+    async def main():
+        audio_player = make_audio_player()
+        audio_player.register_on_speech_end_handler(on_speech_end)
+        silence_page = config_info().silence_page
+
+        # Interrupt lands after the callback read `self.speeches`.  
+        add_speech(audio_player, 'item_0')
+        old_speeches = audio_player.speeches
+        audio_player.interrupt('item_0')
+        new_speeches = audio_player.speeches
+        audio_player.speeches = old_speeches
+        assert on_audio_out(audio_player) == silence_page
+        audio_player.speeches = new_speeches
+
+        # Interrupt lands after the callback checked the speech, before it popped.  
+        speech = add_speech(audio_player, 'item_1')
+        pop = speech.buffer.pop
+        def pop_racing_interrupt():
+            audio_player.interrupt('item_1')
+            return pop()
+        speech.buffer.pop = pop_racing_interrupt    # type: ignore
+        assert on_audio_out(audio_player) != silence_page
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert ended == []
+        assert audio_player._speech_index == {}
+
+    asyncio.run(main())
+
+def test_finished_speech_is_dropped_once():
+    ended: list[tuple[str, str]] = []
+
+    def make_handler(name: str):
+        async def on_speech_end(item_id: str, content_index: int):
+            ended.append((name, item_id))
+        return on_speech_end
+
+    async def main():
+        audio_player = make_audio_player()
+        assert audio_player.playback_tracker_thread_safe is None
+        audio_player.register_on_speech_end_handler(make_handler('a'))
+        audio_player.register_on_speech_end_handler(make_handler('b'))
+        add_speech(audio_player, 'item_0', config_info().n_bytes_per_page + 1)  # flushed tail page
+        assert on_audio_out(audio_player) != config_info().silence_page
+        assert len(audio_player.speeches) == 1
+        assert on_audio_out(audio_player) != config_info().silence_page
+        assert len(audio_player.speeches) == 0
+        assert on_audio_out(audio_player) == config_info().silence_page
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert audio_player._speech_index == {}
+        assert sorted(ended) == [('a', 'item_0'), ('b', 'item_0')]
+
+    asyncio.run(main())
+
+if __name__ == '__main__':
+    pytest.main([__file__])
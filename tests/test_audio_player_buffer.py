@@ -54,6 +54,8 @@ def run_once(seed: int, total_len: int):
             buf.append(chunk)
             i += k
             bytes_appended += k
+            if i == total_len:
+                buf.flush()  # end of speech: enqueue the padded partial page
         else:
             # Pop exactly one full page
             outputs.append(buf.pop()[0])
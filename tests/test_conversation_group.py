@@ -0,0 +1,47 @@
+# pytest tests for ConversationGroup ordering vs. a naive list model.
+
+import random
+import pytest
+
+def run_once(seed: int, n_ops: int):
+    from openai_realtime_api_utils.conversation_group import ConversationGroup
+    from openai_realtime_api_utils.shared import L
+
+    rng = random.Random(seed)
+    group = ConversationGroup()
+    model: list[str] = []
+    next_id = 0
+
+    for _ in range(n_ops):
+        op = rng.choice(['insert', 'insert', 'move', 'trash'])
+        if op == 'insert' or not model:
+            item_id = f'item_{next_id}'
+            next_id += 1
+            previous_item_id = rng.choice([L.root, None, *model])
+            i = 0 if previous_item_id in (L.root, None) else model.index(previous_item_id) + 1
+            model.insert(i, item_id)
+            group.insert_after(ConversationGroup.Cell(item_id=item_id), previous_item_id)
+        elif op == 'move':
+            item_id = rng.choice(model)
+            model.remove(item_id)
+            previous_item_id = rng.choice([L.root, *model])
+            i = 0 if previous_item_id == L.root else model.index(previous_item_id) + 1
+            model.insert(i, item_id)
+            group.move(item_id, previous_item_id)
+        else:
+            item_id = rng.choice(model)
+            model.remove(item_id)
+            group.trash(item_id)
+
+        assert [c.item_id for c in group.iter_main_conversation()] == model
+        for i, item_id in enumerate(model):
+            assert group.seek(item_id) == i
+            assert group.previousItemIdOf(item_id) == (L.root if i == 0 else model[i - 1])
+        assert group.last_item_id() == (model[-1] if model else L.root)
+
+@pytest.mark.parametrize('seed', [1, 22, 333, 4444, 55555])
+def test_order_matches_naive_list(seed):
+    run_once(seed, 300)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
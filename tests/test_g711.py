@@ -0,0 +1,21 @@
+# pytest tests for the G.711 lookup tables vs. audioop.
+
+import warnings
+import pytest
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore', DeprecationWarning)
+    audioop = pytest.importorskip('audioop')
+
+from openai_realtime_api_utils.g711 import alaw2lin16_lut, ulaw2lin16_lut
+
+ALL_CODES = bytes(range(256))
+
+def test_alaw_matches_audioop():
+    assert alaw2lin16_lut(ALL_CODES) == audioop.alaw2lin(ALL_CODES, 2)
+
+def test_ulaw_matches_audioop():
+    assert ulaw2lin16_lut(ALL_CODES) == audioop.ulaw2lin(ALL_CODES, 2)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,51 @@
+# pytest tests for the Interrupt worker surviving a failed interrupt.
+
+import asyncio
+import pytest
+
+pytest.importorskip('agents')
+
+from openai_realtime_api_utils.middlewares.interrupt import Interrupt
+from openai_realtime_api_utils.middlewares.shared import MetadataHandlerRosterManager
+
+class Interruptee:
+    roster_manager = MetadataHandlerRosterManager('Interruptee')
+
+def make_interrupt() -> Interrupt:
+    async def send(_):
+        pass
+    class Connection:
+        pass
+    connection = Connection()
+    connection.send = send  # type: ignore
+    return Interrupt(
+        connection, None, None, None,   # type: ignore
+        on_interrupt_handlers=[], interruptee_type=Interruptee,
+    )
+
+def test_worker_survives_failed_interrupt():
+    handled: list[str] = []
+
+    async def fake_interrupt(item_id: str, content_index: int, elapsed_ms: float):
+        if item_id == 'bad':
+            raise KeyError(item_id)
+        handled.append(item_id)
+
+    async def main():
+        with make_interrupt().context() as interrupt:
+            interrupt._interrupt = fake_interrupt   # type: ignore
+            interrupt._start_interrupt('bad', 0, 0.0)
+            interrupt._start_interrupt('good', 0, 0.0)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert handled == ['good']
+            assert interrupt.interrupt_queue.qsize() == 0
+            worker_task = interrupt._worker_task
+            assert worker_task is not None and not worker_task.done()
+        await asyncio.sleep(0)
+        assert worker_task.cancelled()
+
+    asyncio.run(main())
+
+if __name__ == '__main__':
+    pytest.main([__file__])
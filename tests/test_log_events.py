@@ -0,0 +1,46 @@
+# pytest tests for LogEvents skipping stringification when the level is disabled.
+
+import logging
+import pytest
+
+from openai._models import construct_type_unchecked
+import openai.types.realtime as tp_rt
+
+from openai_realtime_api_utils.middlewares.log_events import LogEvents
+
+def make_server_event() -> tp_rt.RealtimeServerEvent:
+    return construct_type_unchecked(
+        value={
+            'type': 'input_audio_buffer.speech_stopped',
+            'event_id': 'event_0', 'item_id': 'item_0', 'audio_end_ms': 0,
+        },
+        type_=tp_rt.RealtimeServerEvent,    # type: ignore
+    )
+
+@pytest.mark.parametrize('logger_level, expected_n_calls', [
+    (logging.INFO,  0),
+    (logging.DEBUG, 1),
+])
+def test_stringifier_skipped_when_level_disabled(logger_level, expected_n_calls):
+    calls = []
+    def str_server_event(event):
+        calls.append(event)
+        return 'event'
+    def str_client_event(event_param):
+        calls.append(event_param)
+        return 'event_param'
+    log_events = LogEvents(
+        str_server_event=str_server_event,
+        str_client_event=str_client_event,
+    )
+    old_level = log_events.logger.level
+    log_events.logger.setLevel(logger_level)
+    try:
+        log_events.server_event_handler(make_server_event(), {}, None)
+        log_events.client_event_handler({'type': 'response.cancel'}, {}, None)
+    finally:
+        log_events.logger.setLevel(old_level)
+    assert len(calls) == expected_n_calls * 2
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -16,7 +16,9 @@ from daniel_chin_python_alt_stdlib.select_audio_device import (
     select_audio_device_input, select_audio_device_output,
 )
 
-from openai_realtime_api_utils import hook_handlers, middlewares
+from openai_realtime_api_utils import (
+    hook_handlers, middlewares, WEBSOCKET_CONNECTION_OPTIONS, asyncio_run, 
+)
 from openai_realtime_api_utils.middlewares.log_events import unexpected_error_only
 from openai_realtime_api_utils.pyaudio_utils import py_audio_context
 from openai_realtime_api_utils.audio_config import EXAMPLE_SPECIFICATION
@@ -86,6 +88,7 @@ async def main():
 
         async with a_r.connect(
             model='gpt-realtime-mini',
+            websocket_connection_options=WEBSOCKET_CONNECTION_OPTIONS,
         ) as connection:
             # All middlewares are optional.  
             track_config = middlewares.TrackConfig()
@@ -185,4 +188,4 @@ async def main():
                     print('bye.')
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    asyncio_run(main())
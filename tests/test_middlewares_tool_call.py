@@ -19,7 +19,9 @@ from daniel_chin_python_alt_stdlib.select_audio_device import (
     select_audio_device_input, select_audio_device_output,
 )
 
-from openai_realtime_api_utils import hook_handlers, middlewares
+from openai_realtime_api_utils import (
+    hook_handlers, middlewares, WEBSOCKET_CONNECTION_OPTIONS, asyncio_run, 
+)
 from openai_realtime_api_utils.middlewares.log_events import unexpected_error_only
 from openai_realtime_api_utils.middlewares.tool_call_on_speech_end import ToolCallOnSpeechEnd
 from openai_realtime_api_utils.pyaudio_utils import py_audio_context
@@ -74,6 +76,7 @@ async def main():
 
         async with a_r.connect(
             model='gpt-realtime-mini',
+            websocket_connection_options=WEBSOCKET_CONNECTION_OPTIONS,
         ) as connection:
             # All middlewares are optional.  
             track_config = middlewares.TrackConfig()
@@ -177,4 +180,4 @@ async def main():
                 await asyncio.sleep(20)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio_run(main())
@@ -12,7 +12,7 @@ from openai_realtime_api_utils.middlewares import (
     GiveClientEventId, 
 )
 from openai_realtime_api_utils.shared import (
-    hook_handlers,
+    hook_handlers, WEBSOCKET_CONNECTION_OPTIONS, asyncio_run, 
     str_server_event_omit_audio, str_client_event_omit_audio, 
 )
 
@@ -31,6 +31,7 @@ async def main():
     a_r = AsyncRealtime(a_oa)
     async with a_r.connect(
         model='gpt-realtime-mini',
+        websocket_connection_options=WEBSOCKET_CONNECTION_OPTIONS,
     ) as conn:
         with hook_handlers(conn, [sHandler], [
             GiveClientEventId().client_event_handler, cHandler, 
@@ -79,4 +80,4 @@ async def main():
             await asyncio.sleep(3)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio_run(main())
@@ -0,0 +1,73 @@
+# pytest tests for StreamMic's worker wakeup protocol under a real producer thread.
+
+import asyncio
+from base64 import b64decode
+import threading
+import time
+import pytest
+
+pytest.importorskip('pyaudio')
+
+from openai_realtime_api_utils.audio_config import EXAMPLE_SPECIFICATION
+from openai_realtime_api_utils.middlewares.stream_mic import StreamMic, PAYLOAD_SIZE_THRESHOLD
+
+from test_audio_player_buffer import config_info
+
+N_BYTES_PER_PAGE = 4800
+N_BACKLOG_PAGES = PAYLOAD_SIZE_THRESHOLD // N_BYTES_PER_PAGE * 3
+N_PACED_PAGES = 20
+
+class Stream:
+    def start_stream(self): pass
+    def stop_stream(self): pass
+    def close(self): pass
+
+class PyAudio:
+    def open(self, **_):
+        return Stream()
+
+def page(i: int) -> bytes:
+    return i.to_bytes(4, 'big') * (N_BYTES_PER_PAGE // 4)
+
+def test_every_page_sent_once_in_order():
+    payloads: list[bytes] = []
+
+    async def send(event):
+        payloads.append(b64decode(event['audio']))
+        await asyncio.sleep(0)
+
+    def produce(stream_mic: StreamMic):
+        for i in range(N_BACKLOG_PAGES):
+            stream_mic.on_audio_in(page(i), 0, None, None)
+        for i in range(N_BACKLOG_PAGES, N_BACKLOG_PAGES + N_PACED_PAGES):
+            time.sleep(0.003)
+            stream_mic.on_audio_in(page(i), 0, None, None)
+
+    async def main():
+        stream_mic = StreamMic(PyAudio(), EXAMPLE_SPECIFICATION, linger_ms=10.0)   # type: ignore
+        stream_mic.config_info = config_info()
+        stream_mic.niceness_manager.has_set = True
+        stream_mic.register_send_with_handlers(send)
+        expected = b''.join(page(i) for i in range(N_BACKLOG_PAGES + N_PACED_PAGES))
+        with stream_mic.context():
+            stream_mic.maybe_open_stream()
+            (worker_task, ) = [
+                t for t in asyncio.all_tasks() if t.get_name() == 'StreamMic_worker'
+            ]
+            producer = threading.Thread(target=produce, args=(stream_mic, ))
+            producer.start()
+            deadline = time.monotonic() + 5.0
+            while producer.is_alive() or sum(map(len, payloads)) < len(expected):
+                assert time.monotonic() < deadline, 'pages lost'
+                await asyncio.sleep(0.001)
+            producer.join()
+            assert not worker_task.done()
+        await asyncio.wait_for(worker_task, 1.0)
+        assert b''.join(payloads) == expected
+        assert max(map(len, payloads)) < PAYLOAD_SIZE_THRESHOLD + N_BYTES_PER_PAGE
+        assert len(payloads) > len(expected) // PAYLOAD_SIZE_THRESHOLD
+
+    asyncio.run(main())
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,53 @@
+# pytest tests for TrackConversation exposing live streamed transcripts.
+
+from itertools import count
+import pytest
+
+from openai._models import construct_type_unchecked
+import openai.types.realtime as tp_rt
+
+from openai_realtime_api_utils.middlewares.track_conversation import TrackConversation
+
+ITEM = {
+    'id': 'item_0', 'type': 'message', 'role': 'assistant',
+    'status': 'in_progress', 'content': [], 'object': 'realtime.item',
+}
+
+EVENT_IDS = (f'event_{i}' for i in count())
+
+def feed(track_conversation: TrackConversation, events: list[dict]):
+    for event in events:
+        track_conversation.server_event_handler(construct_type_unchecked(
+            value={'event_id': next(EVENT_IDS), **event},
+            type_=tp_rt.RealtimeServerEvent,    # type: ignore
+        ), {}, None)
+
+def transcript_delta(delta: str) -> dict:
+    return {
+        'type': 'response.output_audio_transcript.delta', 'response_id': 'response_0',
+        'item_id': 'item_0', 'output_index': 0, 'content_index': 0, 'delta': delta,
+    }
+
+def test_all_items_sees_live_transcript():
+    track_conversation = TrackConversation()
+    feed(track_conversation, [
+        {'type': 'response.created', 'response': {
+            'id': 'response_0', 'conversation_id': 'conversation_0', 'object': 'realtime.response',
+        }},
+        {'type': 'response.output_item.added', 'response_id': 'response_0', 'output_index': 0, 'item': ITEM},
+        {'type': 'conversation.item.added', 'previous_item_id': None, 'item': ITEM},
+        {
+            'type': 'response.content_part.added', 'response_id': 'response_0', 'item_id': 'item_0',
+            'output_index': 0, 'content_index': 0, 'part': {'type': 'audio', 'transcript': ''},
+        },
+        transcript_delta('Hel'), transcript_delta('lo'),
+    ])
+    def transcript():
+        return track_conversation.all_items['item_0'].content[0].transcript # type: ignore
+    assert transcript() == 'Hello'
+    feed(track_conversation, [transcript_delta(' world')])
+    assert transcript() == 'Hello world'
+    assert track_conversation.get_item('item_0').content[0].transcript == 'Hello world'  # type: ignore
+
+if __name__ == '__main__':
+    pytest.main([__file__])